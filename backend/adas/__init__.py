@@ -1,12 +1,13 @@
 # ADAS Module
 from .distance_estimator import DistanceEstimator
 from .collision_warning import CollisionWarning
-from .lane_keeping import LaneKeeping
+from .lane_keeping import LaneKeeping, LaneKeepingGPU
 from .scene_reconstruction import SceneReconstruction
 
 __all__ = [
     "DistanceEstimator",
     "CollisionWarning", 
     "LaneKeeping",
+    "LaneKeepingGPU",
     "SceneReconstruction",
 ]
@@ -15,8 +15,21 @@ import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import heapq
+import math
 import time
 
+try:
+    import cv2
+except ImportError:  # Core logic stays usable headless
+    cv2 = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional JIT; falls back to NumPy
+    njit = None
+
 
 class WarningLevel(Enum):
     """Warning severity levels."""
@@ -27,6 +40,75 @@ class WarningLevel(Enum):
     CRITICAL = 4
 
 
+# Raw int levels used on the hot path; wrap in WarningLevel at the API boundary
+LEVEL_NONE = WarningLevel.NONE.value
+LEVEL_INFO = WarningLevel.INFO.value
+LEVEL_WARNING = WarningLevel.WARNING.value
+LEVEL_DANGER = WarningLevel.DANGER.value
+LEVEL_CRITICAL = WarningLevel.CRITICAL.value
+
+# Indexed by WarningLevel value
+WARNING_LEVELS = tuple(WarningLevel)
+
+
+def _evaluate_batch_numpy(dist, rel_v, lat, ego_v, ttc_thresholds, dist_thresholds, lateral_threshold):
+    """TTC and warning level (as WarningLevel value) for a batch of objects."""
+    closing = ego_v - rel_v
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ttc = np.where(closing > 0, dist / closing, np.inf)
+    ttc = np.maximum(ttc, 0.0)
+    
+    by_ttc = 4 - np.searchsorted(ttc_thresholds, ttc, side='right')
+    by_distance = 3 - np.searchsorted(dist_thresholds, dist, side='right')
+    
+    # Objects to the side get reduced severity (INFO inside DIST_WARNING)
+    side = (dist < dist_thresholds[2]).astype(np.int8)
+    levels = np.where(
+        np.abs(lat) > lateral_threshold,
+        side,
+        np.where(by_ttc > 0, by_ttc, by_distance),
+    ).astype(np.int8)
+    return ttc, levels
+
+
+def _evaluate_batch_loop(dist, rel_v, lat, ego_v, ttc_thresholds, dist_thresholds, lateral_threshold):
+    """Scalar-loop form of _evaluate_batch_numpy, compiled with numba."""
+    n = dist.shape[0]
+    ttc = np.empty(n, dtype=np.float64)
+    levels = np.empty(n, dtype=np.int8)
+    for i in range(n):
+        closing = ego_v - rel_v[i]
+        t = dist[i] / closing if closing > 0 else np.inf
+        if t < 0:
+            t = 0.0
+        ttc[i] = t
+        
+        if abs(lat[i]) > lateral_threshold:
+            levels[i] = 1 if dist[i] < dist_thresholds[2] else 0
+            continue
+        
+        level = 4
+        for thr in ttc_thresholds:
+            if t >= thr:
+                level -= 1
+        if level == 0:
+            level = 3
+            for thr in dist_thresholds:
+                if dist[i] >= thr:
+                    level -= 1
+        levels[i] = level
+    return ttc, levels
+
+
+# fastmath is left off: non-approaching objects rely on inf TTC.
+# The disk cache is keyed by source file, so skip it when run as a script
+# (a cache entry written by the package import cannot be reloaded there).
+_evaluate_batch = (
+    njit(cache=__name__ != "__main__")(_evaluate_batch_loop) if njit is not None
+    else _evaluate_batch_numpy
+)
+
+
 class WarningType(Enum):
     """Types of collision warnings."""
     FORWARD_COLLISION = "forward_collision"
@@ -37,6 +119,26 @@ class WarningType(Enum):
     LANE_DEPARTURE = "lane_departure"
 
 
+@lru_cache(maxsize=512)
+def _format_warning_message(
+    base_msg: str,
+    warning_type_value: str,
+    object_class: str,
+    dist_deci: int,
+    ttc_deci: Optional[int],
+) -> str:
+    """Format a warning message from distance/TTC in tenths (None = no TTC)."""
+    if warning_type_value == WarningType.PEDESTRIAN.value:
+        target = "Pedestrian"
+    elif warning_type_value == WarningType.CYCLIST.value:
+        target = "Cyclist"
+    else:
+        target = object_class.title()
+    
+    ttc_text = "inf" if ttc_deci is None else f"{ttc_deci / 10:.1f}"
+    return f"{base_msg} {target} at {dist_deci / 10:.1f}m (TTC: {ttc_text}s)"
+
+
 @dataclass
 class CollisionThreat:
     """Represents a potential collision threat."""
@@ -46,13 +148,35 @@ class CollisionThreat:
     relative_velocity: float  # m/s (negative = approaching)
     ttc: float  # Time to collision (seconds)
     lateral_offset: float  # meters from center
-    warning_level: WarningLevel
+    warning_level: int  # WarningLevel value
     warning_type: WarningType
     confidence: float
     
+    @property
+    def warning_level_enum(self) -> WarningLevel:
+        return WARNING_LEVELS[self.warning_level]
+    
     @property
     def is_critical(self) -> bool:
-        return self.warning_level in [WarningLevel.DANGER, WarningLevel.CRITICAL]
+        return self.warning_level >= LEVEL_DANGER
+
+
+@dataclass
+class TrackHistory:
+    """Fixed-size ring buffer of (time, distance, lateral) samples for one object."""
+    t: np.ndarray
+    d: np.ndarray
+    l: np.ndarray
+    head: int = 0
+    count: int = 0
+
+    @classmethod
+    def empty(cls, capacity: int) -> "TrackHistory":
+        return cls(
+            t=np.empty(capacity, dtype=np.float64),
+            d=np.empty(capacity, dtype=np.float64),
+            l=np.empty(capacity, dtype=np.float64),
+        )
 
 
 @dataclass
@@ -60,11 +184,15 @@ class WarningState:
     """Current warning system state."""
     timestamp: float
     active_threats: List[CollisionThreat] = field(default_factory=list)
-    highest_level: WarningLevel = WarningLevel.NONE
+    highest_level: int = LEVEL_NONE  # WarningLevel value
     primary_threat: Optional[CollisionThreat] = None
     warning_message: str = ""
     audio_alert: bool = False
     brake_assist_triggered: bool = False
+    
+    @property
+    def highest_level_enum(self) -> WarningLevel:
+        return WARNING_LEVELS[self.highest_level]
 
 
 class CollisionWarning:
@@ -90,6 +218,31 @@ class CollisionWarning:
     # Lateral threshold for forward collision (meters)
     LATERAL_THRESHOLD = 2.0
     
+    # Overlay colors (BGR) and banner messages, indexed by WarningLevel value
+    _COLORS = (
+        (200, 200, 200),  # NONE
+        (0, 255, 255),    # INFO - Yellow
+        (0, 165, 255),    # WARNING - Orange
+        (0, 0, 200),      # DANGER
+        (0, 0, 255),      # CRITICAL - Red
+    )
+    _MESSAGES = (
+        "",
+        "🟡 Object detected",
+        "🟠 Caution ahead",
+        "🔴 Collision risk!",
+        "⚠️ BRAKE NOW!",
+    )
+    
+    # Threats reported per frame (display shows at most this many)
+    MAX_ACTIVE_THREATS = 5
+    
+    # Samples kept per tracked object
+    HISTORY_CAPACITY = 32
+    
+    # Frames between sweeps of stale tracked objects
+    HISTORY_GC_INTERVAL = 64
+    
     def __init__(
         self,
         ego_velocity: float = 10.0,  # Default ego vehicle velocity (m/s)
@@ -109,8 +262,9 @@ class CollisionWarning:
         self.enable_audio = enable_audio
         
         # Object tracking history
-        self.object_history: Dict[int, List[Tuple[float, float, float]]] = {}  # id -> [(time, distance, lat)]
+        self.object_history: Dict[int, TrackHistory] = {}  # id -> ring buffer of (time, distance, lat)
         self.history_window = 1.0  # seconds
+        self._frame_counter = 0
         
         # Warning state
         self.last_warning_time: Dict[str, float] = {}
@@ -125,6 +279,14 @@ class CollisionWarning:
             "truck": 0.7,
             "bus": 0.7,
         }
+        
+        # Ascending thresholds; the level is the count of thresholds passed
+        self._ttc_thresholds = (
+            self.TTC_CRITICAL, self.TTC_DANGER, self.TTC_WARNING, self.TTC_INFO
+        )
+        self._dist_thresholds = (
+            self.DIST_CRITICAL, self.DIST_DANGER, self.DIST_WARNING
+        )
     
     def update_ego_velocity(self, velocity: float):
         """Update ego vehicle velocity."""
@@ -154,89 +316,120 @@ class CollisionWarning:
         """
         timestamp = timestamp or time.time()
         
-        threats: List[CollisionThreat] = []
-        
-        for obj in detected_objects:
-            if obj.get('confidence', 1.0) < self.min_confidence:
-                continue
-            
-            threat = self._evaluate_threat(obj, frame_width, timestamp)
-            if threat and threat.warning_level != WarningLevel.NONE:
-                threats.append(threat)
+        objects = [
+            obj for obj in detected_objects
+            if obj.get('confidence', 1.0) >= self.min_confidence
+        ]
+        threats = self._evaluate_threats(objects, frame_width, timestamp)
         
-        # Sort by priority (TTC first, then distance)
-        threats.sort(key=lambda t: (t.ttc, t.distance))
+        self._frame_counter += 1
+        if self._frame_counter % self.HISTORY_GC_INTERVAL == 0:
+            self._prune_history(timestamp)
         
         # Determine overall warning state
         state = WarningState(timestamp=timestamp)
-        state.active_threats = threats
         
         if threats:
-            state.primary_threat = threats[0]
+            # Priority: TTC first, then distance. Only the top few are kept,
+            # so a bounded selection replaces a full sort.
+            priority = lambda t: (t.ttc, t.distance)
+            state.active_threats = heapq.nsmallest(
+                self.MAX_ACTIVE_THREATS, threats, key=priority
+            )
+            state.primary_threat = state.active_threats[0]
             state.highest_level = max(t.warning_level for t in threats)
-            state.warning_message = self._generate_warning_message(threats[0])
+            state.warning_message = self._generate_warning_message(state.primary_threat)
             state.audio_alert = (
                 self.enable_audio and 
-                state.highest_level.value >= WarningLevel.WARNING.value
+                state.highest_level >= LEVEL_WARNING
             )
             state.brake_assist_triggered = (
-                state.highest_level == WarningLevel.CRITICAL
+                state.highest_level == LEVEL_CRITICAL
             )
         
         return state
     
-    def _evaluate_threat(
+    def _evaluate_threats(
         self,
-        obj: Dict[str, Any],
+        objects: List[Dict[str, Any]],
         frame_width: int,
         timestamp: float,
-    ) -> Optional[CollisionThreat]:
-        """Evaluate threat level for a single object."""
-        object_id = obj.get('object_id', hash(str(obj)))
-        object_class = obj.get('object_class', 'unknown')
-        distance = obj.get('distance', float('inf'))
-        confidence = obj.get('confidence', 1.0)
-        bbox = obj.get('bbox', (0, 0, 0, 0))
-        
-        if distance <= 0 or distance > self.DIST_SAFE:
-            return None
-        
-        # Calculate lateral offset
-        if bbox:
-            x1, y1, x2, y2 = bbox
-            center_x = (x1 + x2) / 2
-            lateral_offset = (center_x - frame_width / 2) / (frame_width / 2) * 3.0  # Rough meters
-        else:
-            lateral_offset = 0.0
-        
-        # Update tracking history
-        self._update_history(object_id, timestamp, distance, lateral_offset)
-        
-        # Calculate relative velocity from history
-        relative_velocity = self._estimate_velocity(object_id)
-        
-        # Calculate Time to Collision
-        ttc = self._calculate_ttc(distance, relative_velocity)
+    ) -> List[CollisionThreat]:
+        """Evaluate threat levels for all objects of a frame in one vectorized pass."""
+        if not objects:
+            return []
+        
+        n = len(objects)
+        dist = np.fromiter(
+            (obj.get('distance', float('inf')) for obj in objects), np.float64, n
+        )
+        bboxes = [obj.get('bbox', (0, 0, 0, 0)) for obj in objects]
+        center_x = np.fromiter(
+            ((b[0] + b[2]) * 0.5 if b else np.nan for b in bboxes), np.float64, n
+        )
         
-        # Determine warning level
-        warning_level = self._determine_warning_level(
-            distance, ttc, lateral_offset, object_class
+        # Rough lateral offset in meters (0 when no bbox)
+        half_width = frame_width * 0.5
+        lat = np.nan_to_num((center_x - half_width) * (3.0 / half_width))
+        
+        # Bin into distance bands (critical/danger/warning/beyond, using the
+        # distance thresholds) x lateral bands (left/forward/right). Side
+        # objects beyond DIST_WARNING can never warn, so that cell skips
+        # threat evaluation. It is still tracked, so an object cutting in
+        # already has a velocity estimate when it enters the forward band.
+        band_d = np.searchsorted(self._dist_thresholds, dist, side='right')
+        band_l = 1 + np.sign(lat) * (np.abs(lat) > self.LATERAL_THRESHOLD)
+        pruned = (band_l != 1) & (band_d == len(self._dist_thresholds))
+
+        tracked = np.flatnonzero((dist > 0) & (dist <= self.DIST_SAFE))
+        if tracked.size == 0:
+            return []
+        
+        # Tracking history stays per object
+        keep = []
+        object_ids = []
+        for i in tracked:
+            obj = objects[i]
+            object_id = obj.get('object_id', hash(str(obj)))
+            self._update_history(object_id, timestamp, dist[i], lat[i])
+            if not pruned[i]:
+                keep.append(i)
+                object_ids.append(object_id)
+        if not keep:
+            return []
+        keep = np.asarray(keep)
+        dist, lat = dist[keep], lat[keep]
+        rel_v = np.fromiter(
+            (self._estimate_velocity(object_id) for object_id in object_ids),
+            np.float64, keep.size,
         )
         
-        # Determine warning type
-        warning_type = self._determine_warning_type(object_class, lateral_offset)
-        
-        return CollisionThreat(
-            object_id=object_id,
-            object_class=object_class,
-            distance=distance,
-            relative_velocity=relative_velocity,
-            ttc=ttc,
-            lateral_offset=lateral_offset,
-            warning_level=warning_level,
-            warning_type=warning_type,
-            confidence=confidence,
+        # Time to Collision and warning level in one compiled pass
+        # (rows beyond DIST_SAFE were already dropped by the `tracked` filter)
+        ttc, levels = _evaluate_batch(
+            dist, rel_v, lat, float(self.ego_velocity),
+            self._ttc_thresholds, self._dist_thresholds, self.LATERAL_THRESHOLD,
         )
+        
+        # Materialize threats only for surviving rows
+        threats: List[CollisionThreat] = []
+        for j in np.flatnonzero(levels):
+            obj = objects[keep[j]]
+            object_class = obj.get('object_class', 'unknown')
+            lateral_offset = float(lat[j])
+            threats.append(CollisionThreat(
+                object_id=object_ids[j],
+                object_class=object_class,
+                distance=float(dist[j]),
+                relative_velocity=float(rel_v[j]),
+                ttc=float(ttc[j]),
+                lateral_offset=lateral_offset,
+                warning_level=int(levels[j]),
+                warning_type=self._determine_warning_type(object_class, lateral_offset),
+                confidence=obj.get('confidence', 1.0),
+            ))
+        
+        return threats
     
     def _update_history(
         self,
@@ -246,28 +439,48 @@ class CollisionWarning:
         lateral: float,
     ):
         """Update object tracking history."""
-        if object_id not in self.object_history:
-            self.object_history[object_id] = []
-        
-        history = self.object_history[object_id]
-        history.append((timestamp, distance, lateral))
-        
-        # Remove old entries
-        cutoff = timestamp - self.history_window
-        self.object_history[object_id] = [
-            (t, d, l) for t, d, l in history if t > cutoff
+        history = self.object_history.get(object_id)
+        if history is None:
+            history = TrackHistory.empty(self.HISTORY_CAPACITY)
+            self.object_history[object_id] = history
+        
+        # Overwrite oldest slot; stale samples are masked out on read
+        head = history.head
+        history.t[head] = timestamp
+        history.d[head] = distance
+        history.l[head] = lateral
+        history.head = (head + 1) % self.HISTORY_CAPACITY
+        history.count = min(history.count + 1, self.HISTORY_CAPACITY)
+    
+    def _prune_history(self, timestamp: float):
+        """Drop objects not seen within twice the history window."""
+        cutoff = timestamp - 2 * self.history_window
+        k = self.HISTORY_CAPACITY
+        stale = [
+            object_id for object_id, history in self.object_history.items()
+            if history.t[(history.head - 1) % k] < cutoff
         ]
+        for object_id in stale:
+            del self.object_history[object_id]
     
     def _estimate_velocity(self, object_id: int) -> float:
         """Estimate relative velocity from tracking history."""
-        history = self.object_history.get(object_id, [])
+        history = self.object_history.get(object_id)
         
-        if len(history) < 2:
+        if history is None or history.count < 2:
             return 0.0
         
-        # Use first and last points
-        t1, d1, _ = history[0]
-        t2, d2, _ = history[-1]
+        # Chronological slot order, oldest first
+        k = self.HISTORY_CAPACITY
+        order = (history.head - history.count + np.arange(history.count)) % k
+        times = history.t[order]
+        
+        # Use first point inside the window and last point
+        cutoff = times[-1] - self.history_window
+        first = int(np.argmax(times > cutoff))
+        
+        t1, d1 = times[first], history.d[order[first]]
+        t2, d2 = times[-1], history.d[order[-1]]
         
         dt = t2 - t1
         if dt < 0.01:
@@ -275,56 +488,7 @@ class CollisionWarning:
         
         # Negative velocity = approaching
         velocity = (d2 - d1) / dt
-        return velocity
-    
-    def _calculate_ttc(self, distance: float, relative_velocity: float) -> float:
-        """Calculate Time to Collision."""
-        # Relative velocity with ego motion
-        # Negative relative_velocity means object is approaching
-        closing_velocity = self.ego_velocity - relative_velocity
-        
-        if closing_velocity <= 0:
-            return float('inf')  # Not approaching
-        
-        ttc = distance / closing_velocity
-        return max(0, ttc)
-    
-    def _determine_warning_level(
-        self,
-        distance: float,
-        ttc: float,
-        lateral_offset: float,
-        object_class: str,
-    ) -> WarningLevel:
-        """Determine warning level based on threat parameters."""
-        
-        # Check if object is in our path (lateral threshold)
-        if abs(lateral_offset) > self.LATERAL_THRESHOLD:
-            # Object is to the side, reduce severity
-            return WarningLevel.INFO if distance < self.DIST_WARNING else WarningLevel.NONE
-        
-        # Priority boost for vulnerable road users
-        priority = self.class_priority.get(object_class, 0.5)
-        
-        # TTC-based warnings
-        if ttc < self.TTC_CRITICAL:
-            return WarningLevel.CRITICAL
-        elif ttc < self.TTC_DANGER:
-            return WarningLevel.DANGER
-        elif ttc < self.TTC_WARNING:
-            return WarningLevel.WARNING
-        elif ttc < self.TTC_INFO:
-            return WarningLevel.INFO
-        
-        # Distance-based fallback
-        if distance < self.DIST_CRITICAL:
-            return WarningLevel.DANGER
-        elif distance < self.DIST_DANGER:
-            return WarningLevel.WARNING
-        elif distance < self.DIST_WARNING:
-            return WarningLevel.INFO
-        
-        return WarningLevel.NONE
+        return float(velocity)
     
     def _determine_warning_type(
         self,
@@ -343,28 +507,21 @@ class CollisionWarning:
     
     def _generate_warning_message(self, threat: CollisionThreat) -> str:
         """Generate human-readable warning message."""
-        messages = {
-            WarningLevel.CRITICAL: "⚠️ BRAKE NOW!",
-            WarningLevel.DANGER: "🔴 Collision risk!",
-            WarningLevel.WARNING: "🟠 Caution ahead",
-            WarningLevel.INFO: "🟡 Object detected",
-        }
-        
-        base_msg = messages.get(threat.warning_level, "")
-        
-        if threat.warning_type == WarningType.PEDESTRIAN:
-            target = "Pedestrian"
-        elif threat.warning_type == WarningType.CYCLIST:
-            target = "Cyclist"
-        else:
-            target = threat.object_class.title()
-        
-        return f"{base_msg} {target} at {threat.distance:.1f}m (TTC: {threat.ttc:.1f}s)"
+        # Quantize to the displayed 0.1 resolution so stable threats hit the cache
+        ttc_deci = round(threat.ttc * 10) if math.isfinite(threat.ttc) else None
+        return _format_warning_message(
+            self._MESSAGES[threat.warning_level],
+            threat.warning_type.value,
+            threat.object_class,
+            round(threat.distance * 10),
+            ttc_deci,
+        )
     
     def draw_warnings(
         self,
         frame: np.ndarray,
         state: WarningState,
+        inplace: bool = False,
     ) -> np.ndarray:
         """
         Draw warning overlays on frame.
@@ -372,31 +529,29 @@ class CollisionWarning:
         Args:
             frame: BGR image
             state: Current warning state
+            inplace: Draw directly on `frame` instead of a copy
             
         Returns:
-            Frame with warning overlays
+            Frame with warning overlays (the input frame itself when
+            there is nothing to draw or inplace=True)
         """
-        import cv2
+        if cv2 is None:
+            raise ImportError("OpenCV (cv2) is required for draw_warnings")
         
-        output = frame.copy()
-        h, w = output.shape[:2]
+        # Nothing to draw: hand back the input without copying
+        if not state.active_threats and state.highest_level < LEVEL_WARNING:
+            return frame
         
-        # Warning colors
-        colors = {
-            WarningLevel.CRITICAL: (0, 0, 255),  # Red
-            WarningLevel.DANGER: (0, 0, 200),
-            WarningLevel.WARNING: (0, 165, 255),  # Orange
-            WarningLevel.INFO: (0, 255, 255),  # Yellow
-        }
+        output = frame if inplace else frame.copy()
+        h, w = output.shape[:2]
         
         # Draw warning banner if active
-        if state.highest_level.value >= WarningLevel.WARNING.value:
-            color = colors.get(state.highest_level, (255, 255, 255))
+        if state.highest_level >= LEVEL_WARNING:
+            color = self._COLORS[state.highest_level]
             
-            # Semi-transparent overlay at top
-            overlay = output.copy()
-            cv2.rectangle(overlay, (0, 0), (w, 60), color, -1)
-            output = cv2.addWeighted(overlay, 0.4, output, 0.6, 0)
+            # Semi-transparent overlay at top, blended in place on the banner rows only
+            banner = output[:60]
+            cv2.addWeighted(np.full_like(banner, color), 0.4, banner, 0.6, 0, dst=banner)
             
             # Warning text
             cv2.putText(
@@ -408,7 +563,7 @@ class CollisionWarning:
         # Draw TTC for each threat
         for i, threat in enumerate(state.active_threats[:5]):  # Max 5
             y = 80 + i * 25
-            color = colors.get(threat.warning_level, (200, 200, 200))
+            color = self._COLORS[threat.warning_level]
             
             text = f"{threat.object_class}: {threat.distance:.1f}m | TTC: {threat.ttc:.1f}s"
             cv2.putText(
@@ -418,7 +573,7 @@ class CollisionWarning:
             )
         
         # Draw danger zone indicator
-        if state.highest_level == WarningLevel.CRITICAL:
+        if state.highest_level == LEVEL_CRITICAL:
             # Flash border
             if int(time.time() * 4) % 2:  # Flash at 4Hz
                 cv2.rectangle(output, (0, 0), (w - 1, h - 1), (0, 0, 255), 10)
@@ -460,7 +615,7 @@ if __name__ == "__main__":
     # Analyze threats
     state = cws.analyze(test_objects, frame_width=640)
     
-    print(f"\nWarning Level: {state.highest_level.name}")
+    print(f"\nWarning Level: {state.highest_level_enum.name}")
     print(f"Message: {state.warning_message}")
     print(f"Active Threats: {len(state.active_threats)}")
     
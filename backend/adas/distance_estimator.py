@@ -10,10 +10,70 @@ Features:
 - Camera calibration support
 """
 
+import bisect
 import numpy as np
 from typing import Tuple, Optional, List
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+except ImportError:  # Optional JIT; falls back to NumPy
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:  # Optional GPU path
+    cp = None
+
+
+def _bbox_max_loop(depth, bboxes, out):
+    """Max depth inside each (x1, y1, x2, y2) box; NaN for empty boxes."""
+    h, w = depth.shape
+    for k in prange(bboxes.shape[0]):
+        x1 = max(0, bboxes[k, 0])
+        y1 = max(0, bboxes[k, 1])
+        x2 = min(w, bboxes[k, 2])
+        y2 = min(h, bboxes[k, 3])
+        if x2 <= x1 or y2 <= y1:
+            out[k] = np.nan
+            continue
+        m = depth[y1, x1]
+        for i in range(y1, y2):
+            for j in range(x1, x2):
+                if depth[i, j] > m:
+                    m = depth[i, j]
+        out[k] = m
+
+
+def _bbox_max_numpy(depth, bboxes, out):
+    """NumPy fallback for _bbox_max_loop."""
+    h, w = depth.shape
+    for k, (x1, y1, x2, y2) in enumerate(bboxes):
+        x1, x2 = max(0, x1), min(w, x2)
+        y1, y2 = max(0, y1), min(h, y2)
+        out[k] = depth[y1:y2, x1:x2].max() if x2 > x1 and y2 > y1 else np.nan
+
+
+_bbox_max = (
+    njit(parallel=True, cache=True)(_bbox_max_loop) if njit is not None
+    else _bbox_max_numpy
+)
+
+
+def _depth_to_dist_loop(depth, scale, out):
+    """Fused load -> divide -> clip -> store over a 2D depth map."""
+    h, w = depth.shape
+    for i in prange(h):
+        for j in range(w):
+            v = depth[i, j]
+            out[i, j] = min(scale / v, 100.0) if v > 0.01 else 100.0
+
+
+_depth_to_dist_kernel = (
+    njit(parallel=True, fastmath=True, cache=True)(_depth_to_dist_loop)
+    if njit is not None else None
+)
+
 
 @dataclass
 class CameraCalibration:
@@ -49,6 +109,15 @@ class DistanceEstimator:
     using camera calibration parameters.
     """
     
+    # Zone names and BGR colors, indexed by zone (danger, warning, safe)
+    _ZONE_NAMES = ("danger", "warning", "safe")
+    _ZONE_COLORS = np.array([
+        [0, 0, 255],    # Red
+        [0, 165, 255],  # Orange
+        [0, 255, 0],    # Green
+    ], dtype=np.uint8)
+    _ZONE_COLOR_TUPLES = tuple(tuple(c) for c in _ZONE_COLORS.tolist())
+    
     def __init__(self, calibration: Optional[CameraCalibration] = None):
         """
         Initialize distance estimator.
@@ -62,7 +131,33 @@ class DistanceEstimator:
         self.zone_danger = 5.0      # Red zone
         self.zone_warning = 15.0    # Orange zone
         self.zone_safe = 30.0       # Green zone
-    
+        
+        # Distance per 8-bit quantized depth value (see create_distance_map_u8)
+        self._depth_lut: Optional[np.ndarray] = None
+        self._update_depth_lut()
+
+        # Per-frame integral image (see prepare_frame)
+        self._integral: Optional[np.ndarray] = None
+        self._integral_src: Optional[np.ndarray] = None
+
+    def prepare_frame(self, depth_map: np.ndarray):
+        """
+        Precompute an integral image of the depth map for O(1) window means.
+
+        Call once per frame before issuing many estimate_at_point /
+        estimate_for_bbox queries against the same depth map.
+
+        Args:
+            depth_map: Normalized depth map (0-1, higher = closer)
+        """
+        h, w = depth_map.shape[:2]
+        integral = np.zeros((h + 1, w + 1), dtype=np.float64)
+        np.cumsum(depth_map, axis=0, dtype=np.float64, out=integral[1:, 1:])
+        np.cumsum(integral[1:, 1:], axis=1, out=integral[1:, 1:])
+
+        self._integral = integral
+        self._integral_src = depth_map
+
     def estimate_at_point(
         self,
         depth_map: np.ndarray,
@@ -87,13 +182,23 @@ class DistanceEstimator:
         x = max(window_size, min(w - window_size - 1, x))
         y = max(window_size, min(h - window_size - 1, y))
         
-        # Get average depth in window
-        window = depth_map[
-            y - window_size:y + window_size + 1,
-            x - window_size:x + window_size + 1
-        ]
-        
-        avg_depth = np.mean(window)
+        if self._integral is not None and depth_map is self._integral_src:
+            # Window sum from 4 integral image lookups
+            I = self._integral
+            k = window_size
+            total = (
+                I[y + k + 1, x + k + 1] - I[y - k, x + k + 1]
+                - I[y + k + 1, x - k] + I[y - k, x - k]
+            )
+            avg_depth = total / (2 * k + 1) ** 2
+        else:
+            # Get average depth in window
+            window = depth_map[
+                y - window_size:y + window_size + 1,
+                x - window_size:x + window_size + 1
+            ]
+
+            avg_depth = np.mean(window)
         
         # Convert to metric distance
         return self._depth_to_distance(avg_depth)
@@ -158,6 +263,40 @@ class DistanceEstimator:
         else:
             raise ValueError(f"Unknown method: {method}")
     
+    def estimate_for_bboxes(
+        self,
+        depth_map: np.ndarray,
+        bboxes: np.ndarray,
+        method: str = "bottom_center"
+    ) -> np.ndarray:
+        """
+        Estimate distances for many bounding boxes in one call.
+        
+        Args:
+            depth_map: Normalized depth map
+            bboxes: (N, 4) array of x1, y1, x2, y2 boxes
+            method: Distance estimation method (see estimate_for_bbox)
+            
+        Returns:
+            (N,) array of distances in meters (inf for empty boxes)
+        """
+        bboxes = np.asarray(bboxes, dtype=np.int64).reshape(-1, 4)
+        
+        if method != "min":
+            return np.array([
+                self.estimate_for_bbox(depth_map, *map(int, b), method=method)
+                for b in bboxes
+            ], dtype=np.float64)
+        
+        depth = np.ascontiguousarray(depth_map, dtype=np.float32)
+        max_vals = np.empty(len(bboxes), dtype=np.float32)
+        _bbox_max(depth, bboxes, max_vals)
+        
+        empty = np.isnan(max_vals)
+        distances = self._depths_to_distances(np.nan_to_num(max_vals))
+        distances[empty] = np.inf
+        return distances
+    
     def estimate_ground_distance(
         self,
         depth_map: np.ndarray,
@@ -177,14 +316,9 @@ class DistanceEstimator:
         y = int(h * y_ratio)
         
         # Get depth values along horizontal line
-        depth_line = depth_map[y, :]
-        
-        # Convert to distances
-        distances = np.array([
-            self._depth_to_distance(d) for d in depth_line
-        ])
-        
-        return distances
+        depth_line = depth_map[y, :].astype(np.float32, copy=False)
+
+        return self._depths_to_distances(depth_line)
     
     def create_distance_map(self, depth_map: np.ndarray) -> np.ndarray:
         """
@@ -196,6 +330,12 @@ class DistanceEstimator:
         Returns:
             Distance map in meters
         """
+        if _depth_to_dist_kernel is not None and depth_map.ndim == 2:
+            # Single fused pass, no np.where temporary
+            out = np.empty(depth_map.shape, dtype=np.result_type(depth_map, np.float32))
+            _depth_to_dist_kernel(depth_map, float(self.calibration.depth_scale), out)
+            return out
+        
         # Vectorized conversion
         distance_map = np.where(
             depth_map > 0.01,
@@ -205,6 +345,61 @@ class DistanceEstimator:
         
         return np.clip(distance_map, 0, 100)
     
+    def create_distance_map_u8(self, depth_u8: np.ndarray) -> np.ndarray:
+        """
+        Convert an 8-bit quantized depth map (0-255 = 0-1) to distances.
+        
+        A single LUT gather: no per-pixel arithmetic or division.
+        
+        Args:
+            depth_u8: uint8 depth map
+            
+        Returns:
+            float32 distance map in meters
+        """
+        return self._depth_lut[depth_u8]
+    
+    def create_distance_map_gpu(self, depth_map):
+        """
+        Convert a GPU-resident depth map to a distance map without leaving the device.
+        
+        Args:
+            depth_map: cupy.ndarray (H, W) float32, normalized 0-1, C-contiguous.
+                A torch CUDA tensor can be handed off zero-copy with
+                cupy.from_dlpack(torch.utils.dlpack.to_dlpack(tensor)).
+                
+        Returns:
+            cupy.ndarray distance map in meters (same device)
+        """
+        if cp is None:
+            raise ImportError("CuPy is required for create_distance_map_gpu")
+        
+        distance_map = cp.where(
+            depth_map > 0.01,
+            self.calibration.depth_scale / cp.maximum(depth_map, 1e-6),
+            100.0
+        )
+        return cp.clip(distance_map, 0, 100, out=distance_map)
+    
+    def estimate_ground_distance_gpu(self, depth_map, y_ratio: float = 0.9):
+        """
+        GPU counterpart of estimate_ground_distance for a cupy depth map.
+        
+        Args:
+            depth_map: cupy.ndarray (H, W) normalized depth map
+            y_ratio: Y position ratio (0=top, 1=bottom)
+            
+        Returns:
+            cupy.ndarray of distances across image width
+        """
+        h = depth_map.shape[0]
+        return self.create_distance_map_gpu(depth_map[int(h * y_ratio), :])
+    
+    @property
+    def _zone_thresholds(self) -> Tuple[float, float]:
+        """Ascending zone boundaries; the zone index is the count passed."""
+        return (self.zone_danger, self.zone_warning)
+    
     def get_zone(self, distance: float) -> str:
         """
         Get danger zone for given distance.
@@ -215,12 +410,7 @@ class DistanceEstimator:
         Returns:
             Zone name: "danger", "warning", or "safe"
         """
-        if distance < self.zone_danger:
-            return "danger"
-        elif distance < self.zone_warning:
-            return "warning"
-        else:
-            return "safe"
+        return self._ZONE_NAMES[bisect.bisect_right(self._zone_thresholds, distance)]
     
     def get_zone_color(self, distance: float) -> Tuple[int, int, int]:
         """
@@ -232,13 +422,20 @@ class DistanceEstimator:
         Returns:
             BGR color tuple
         """
-        zone = self.get_zone(distance)
-        if zone == "danger":
-            return (0, 0, 255)  # Red
-        elif zone == "warning":
-            return (0, 165, 255)  # Orange
-        else:
-            return (0, 255, 0)  # Green
+        return self._ZONE_COLOR_TUPLES[bisect.bisect_right(self._zone_thresholds, distance)]
+    
+    def get_zone_colors(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Get BGR colors for many distances at once.
+        
+        Args:
+            distances: Array of distances in meters
+            
+        Returns:
+            (N, 3) uint8 array of BGR colors
+        """
+        zones = np.searchsorted(self._zone_thresholds, distances, side='right')
+        return self._ZONE_COLORS[zones]
     
     def _depth_to_distance(self, depth: float) -> float:
         """
@@ -258,6 +455,22 @@ class DistanceEstimator:
         
         return min(distance, 100.0)
     
+    def _depths_to_distances(self, depths: np.ndarray) -> np.ndarray:
+        """Vectorized _depth_to_distance over an array of depth values."""
+        distances = np.where(
+            depths > 0.01,
+            self.calibration.depth_scale / np.maximum(depths, 1e-6),
+            100.0
+        )
+        np.minimum(distances, 100.0, out=distances)
+        return distances
+    
+    def _update_depth_lut(self):
+        """Rebuild the 256-entry uint8 depth -> distance LUT for the current scale."""
+        self._depth_lut = self._depths_to_distances(
+            np.arange(256, dtype=np.float64) / 255.0
+        ).astype(np.float32)
+    
     def calibrate_from_known_distance(
         self,
         depth_value: float,
@@ -272,6 +485,7 @@ class DistanceEstimator:
         """
         if depth_value > 0.01:
             self.calibration.depth_scale = actual_distance * depth_value
+            self._update_depth_lut()
             print(f"✅ Calibrated depth_scale = {self.calibration.depth_scale:.2f}")
     
     def get_closest_object_distance(
@@ -298,11 +512,10 @@ class DistanceEstimator:
             offset = (0, 0)
         
         # Find maximum depth (closest point)
-        max_idx = np.unravel_index(np.argmax(region), region.shape)
-        max_depth = region[max_idx]
-        
+        y, x = np.unravel_index(np.argmax(region), region.shape)
+        max_depth = region[y, x]
+
         # Convert to image coordinates
-        y, x = max_idx
         x += offset[0]
         y += offset[1]
         
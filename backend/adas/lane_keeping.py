@@ -11,6 +11,7 @@ Features:
 - Steering angle suggestion
 """
 
+import math
 import numpy as np
 import cv2
 from typing import Tuple, Optional, List
@@ -18,6 +19,207 @@ from dataclasses import dataclass
 from enum import Enum
 import time
 
+try:
+    from numba import njit, prange
+except ImportError:  # Optional JIT; falls back to OpenCV/NumPy
+    njit = None
+
+try:
+    import torch
+    import kornia
+except ImportError:  # Optional GPU path (LaneKeepingGPU)
+    torch = kornia = None
+
+
+# Band on the raw 3x3 Sobel X magnitude of the 8-bit L/gray image (the
+# old per-frame max normalization put it at roughly this range for
+# typical lane contrast)
+_SOBEL_MIN = 80
+_SOBEL_MAX = 400
+
+
+def _lane_mask_loop(hls, sobelx, out):
+    """
+    Single pass over an HLS image writing the OR of the S, L, yellow-hue and
+    Sobel-X thresholds used by _lane_mask (255 = lane candidate).
+    """
+    h, w = out.shape
+    for i in prange(h):
+        for j in range(w):
+            hue = hls[i, j, 0]
+            s = hls[i, j, 2]
+            hit = (
+                s >= 100 or hls[i, j, 1] >= 200
+                or (s >= 80 and hue >= 15 and hue <= 35)
+            )
+            
+            # |Sobel X| within the gradient band
+            if not hit:
+                sv = abs(int(sobelx[i, j]))
+                hit = sv >= _SOBEL_MIN and sv <= _SOBEL_MAX
+            
+            out[i, j] = 255 if hit else 0
+
+
+_lane_mask_kernel = (
+    njit(parallel=True, fastmath=True, cache=__name__ != "__main__")(_lane_mask_loop)
+    if njit is not None else None
+)
+
+
+def _build_color_lut() -> np.ndarray:
+    """
+    255/0 lane-color decision for each cell of a 32x32x32 BGR grid, indexed
+    by (r >> 3) << 10 | (g >> 3) << 5 | (b >> 3). Cells are classified at
+    their center with the same HLS thresholds as _lane_mask.
+    """
+    q = np.arange(32, dtype=np.uint8) * 8 + 4
+    r, g, b = np.meshgrid(q, q, q, indexing="ij")
+    cells = np.stack([b, g, r], axis=-1).reshape(1, -1, 3)
+    hls = cv2.cvtColor(cells, cv2.COLOR_BGR2HLS)[0]
+    hue, light, sat = hls[:, 0], hls[:, 1], hls[:, 2]
+    hit = (sat >= 100) | (light >= 200) | ((sat >= 80) & (hue >= 15) & (hue <= 35))
+    return np.where(hit, 255, 0).astype(np.uint8)
+
+
+_COLOR_LUT = _build_color_lut()
+
+
+def _color_lut_mask(bgr: np.ndarray) -> np.ndarray:
+    """NumPy lookup of _COLOR_LUT for a BGR image."""
+    q = bgr >> 3
+    idx = q[:, :, 2].astype(np.uint16) << 10
+    idx |= q[:, :, 1].astype(np.uint16) << 5
+    idx |= q[:, :, 0]
+    return _COLOR_LUT[idx]
+
+
+def _lane_mask_lut_loop(bgr, lut, sobelx, out):
+    """_lane_mask_loop with the color tests replaced by one _COLOR_LUT lookup."""
+    h, w = out.shape
+    for i in prange(h):
+        for j in range(w):
+            idx = (
+                ((int(bgr[i, j, 2]) >> 3) << 10)
+                | ((int(bgr[i, j, 1]) >> 3) << 5)
+                | (int(bgr[i, j, 0]) >> 3)
+            )
+            hit = lut[idx] != 0
+            
+            if not hit:
+                sv = abs(int(sobelx[i, j]))
+                hit = sv >= _SOBEL_MIN and sv <= _SOBEL_MAX
+            
+            out[i, j] = 255 if hit else 0
+
+
+_lane_mask_lut_kernel = (
+    njit(parallel=True, fastmath=True, cache=__name__ != "__main__")(_lane_mask_lut_loop)
+    if njit is not None else None
+)
+
+
+def _fit_lane_loop(binary, offset, n_windows, margin, min_pixels, coef):
+    """
+    Sliding-window search over a 0/255 half mask that accumulates the
+    normal-equation moments of x = a*y^2 + b*y + c as it goes, then solves
+    the 3x3 system by Cramer's rule into coef.
+    
+    Returns the number of lane pixels used (0 if none or degenerate).
+    """
+    h, w = binary.shape
+    
+    # Starting column from histogram of bottom quarter
+    best = 0
+    base = 0
+    for j in range(w):
+        col = 0
+        for i in range(3 * h // 4, h):
+            col += binary[i, j]
+        if col > best:
+            best = col
+            base = j
+    if best == 0:
+        return 0
+    
+    window_height = h // n_windows
+    current = base
+    
+    # y is mapped to t = (y - h/2) / h to keep the moments well conditioned
+    half_h = 0.5 * h
+    inv_h = 1.0 / h
+    n = 0
+    st = st2 = st3 = st4 = 0.0
+    sx = stx = st2x = 0.0
+    
+    for window in range(n_windows):
+        win_y_low = h - (window + 1) * window_height
+        win_y_high = h - window * window_height
+        win_x_low = max(0, current - margin)
+        win_x_high = min(w, current + margin)
+        
+        count = 0
+        sum_x = 0
+        for i in range(win_y_low, win_y_high):
+            t = (i - half_h) * inv_h
+            t2 = t * t
+            for j in range(win_x_low, win_x_high):
+                if binary[i, j] != 0:
+                    x = float(j + offset)
+                    count += 1
+                    sum_x += j
+                    st += t
+                    st2 += t2
+                    st3 += t2 * t
+                    st4 += t2 * t2
+                    sx += x
+                    stx += t * x
+                    st2x += t2 * x
+        n += count
+        
+        # Recenter next window
+        if count > min_pixels:
+            current = sum_x // count
+    
+    if n < 10:
+        return 0
+    
+    # Normal equations [[st4, st3, st2], [st3, st2, st], [st2, st, n]] p = [st2x, stx, sx]
+    m00, m01, m02 = st4, st3, st2
+    m11, m12, m22 = st2, st, float(n)
+    c00 = m11 * m22 - m12 * m12
+    c01 = m02 * m12 - m01 * m22
+    c02 = m01 * m12 - m02 * m11
+    det = m00 * c00 + m01 * c01 + m02 * c02
+    if abs(det) < 1e-12 * n:
+        return 0
+    c11 = m00 * m22 - m02 * m02
+    c12 = m01 * m02 - m00 * m12
+    c22 = m00 * m11 - m01 * m01
+    pa = (c00 * st2x + c01 * stx + c02 * sx) / det
+    pb = (c01 * st2x + c11 * stx + c12 * sx) / det
+    pc = (c02 * st2x + c12 * stx + c22 * sx) / det
+    
+    # Undo t = (y - h/2) / h
+    a = pa * inv_h * inv_h
+    b = pb * inv_h - 2.0 * a * half_h
+    coef[0] = a
+    coef[1] = b
+    coef[2] = pc - pb * half_h * inv_h + a * half_h * half_h
+    return n
+
+
+_fit_lane_kernel = (
+    njit(fastmath=True, cache=__name__ != "__main__")(_fit_lane_loop)
+    if njit is not None else None
+)
+
+
+def _poly2(coef: np.ndarray, y):
+    """Evaluate x = a*y^2 + b*y + c (scalar or array y) without np.polyval."""
+    a, b, c = coef
+    return (a * y + b) * y + c
+
 
 class LaneDepartureStatus(Enum):
     """Lane departure status."""
@@ -51,6 +253,22 @@ class LaneState:
     suggested_steering: float = 0.0
 
 
+@dataclass
+class LaneHistory:
+    """Ring buffer of recent lane polynomials with a running coefficient sum."""
+    buf: np.ndarray
+    total: np.ndarray
+    head: int = 0
+    count: int = 0
+    
+    @classmethod
+    def empty(cls, capacity: int, n_coeffs: int = 3) -> "LaneHistory":
+        return cls(
+            buf=np.zeros((capacity, n_coeffs), dtype=np.float64),
+            total=np.zeros(n_coeffs, dtype=np.float64),
+        )
+
+
 class LaneKeeping:
     """
     Lane Keeping Assist (LKA) System
@@ -68,11 +286,17 @@ class LaneKeeping:
     MAX_LANE_WIDTH = 4.5  # meters
     DEFAULT_LANE_WIDTH = 3.5  # meters
     
+    # Steering P-controller gains
+    KP_OFFSET = 2.0  # Gain for center offset
+    KP_HEADING = 0.5  # Gain for heading angle
+    
     def __init__(
         self,
         roi_top_ratio: float = 0.55,
         history_size: int = 7,
         enable_smoothing: bool = True,
+        half_resolution: bool = True,
+        color_lut: bool = False,
     ):
         """
         Initialize lane keeping system.
@@ -81,14 +305,19 @@ class LaneKeeping:
             roi_top_ratio: Top of ROI as ratio of image height
             history_size: Number of frames for lane smoothing
             enable_smoothing: Enable temporal smoothing
+            half_resolution: Extract lane pixels from a pyrDown'd warped image
+            color_lut: Classify lane colors with a 32^3 BGR lookup table instead
+                of an HLS conversion (cheaper; approximate near thresholds)
         """
         self.roi_top_ratio = roi_top_ratio
         self.history_size = history_size
         self.enable_smoothing = enable_smoothing
+        self.half_resolution = half_resolution
+        self.color_lut = color_lut
         
         # Lane history for smoothing
-        self.left_history: List[np.ndarray] = []
-        self.right_history: List[np.ndarray] = []
+        self.left_history = LaneHistory.empty(history_size)
+        self.right_history = LaneHistory.empty(history_size)
         
         # Camera calibration (pixels per meter at different heights)
         self.ppm_bottom = 100  # pixels per meter at bottom of image
@@ -98,6 +327,24 @@ class LaneKeeping:
         self.M = None
         self.Minv = None
         self.warped_size = (400, 600)
+        
+        # Fixed-point remap tables for M (warp) and Minv (unwarp), built
+        # alongside the matrices so no frame recomputes the mapping
+        self._warp_maps = None
+        self._unwarp_maps = None
+        self._unwarp_size = None
+        
+        # Per-frame work buffers (allocated on first frame, reused after)
+        self._warped = self._warped_half = None
+        self._hls = self._gray = self._sobelx = self._combined = None
+        
+        # draw_lane buffers: overlay image, sample rows, and polygon points
+        # (left curve top-down, then right curve bottom-up)
+        self._lane_img = None
+        self._y_points = None
+        self._pts_buf = None
+        self._Y50 = None
+        self._x_buf = None
     
     def detect(self, frame: np.ndarray) -> LaneState:
         """
@@ -115,25 +362,69 @@ class LaneKeeping:
         if self.M is None:
             self._compute_perspective(w, h)
         
+        if self._warped is None:
+            self._allocate_buffers()
+        
         # Apply perspective transform
-        warped = cv2.warpPerspective(frame, self.M, self.warped_size)
+        warped = cv2.remap(frame, *self._warp_maps, cv2.INTER_LINEAR, dst=self._warped)
         
-        # Extract lane pixels
-        left_pixels, right_pixels = self._extract_lane_pixels(warped)
+        # Half resolution quarters the pixel work for mask and search
+        if self.half_resolution:
+            warped = cv2.pyrDown(warped, dst=self._warped_half)
         
         # Fit polynomials
-        left_poly = self._fit_polynomial(left_pixels) if len(left_pixels[0]) > 100 else None
-        right_poly = self._fit_polynomial(right_pixels) if len(right_pixels[0]) > 100 else None
+        left_poly, right_poly = self._fit_lanes(self._lane_mask(warped))
+        
+        return self._update_state(left_poly, right_poly, w, h)
+    
+    def _fit_lanes(
+        self,
+        combined: np.ndarray,
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Fit both lane lines in a lane mask, in full warped coordinates."""
+        # Window sizes and pixel counts scale with the working resolution
+        # and the fits are mapped back to full size
+        scale = 2 if self.half_resolution else 1
+        margin = 50 // scale
+        min_pixels = 50 // (scale * scale)
+        min_lane_pixels = 100 // (scale * scale)
+        
+        if _fit_lane_kernel is not None:
+            # Search and fit both halves without materializing pixel lists
+            left_poly, right_poly = self._fit_lanes_jit(
+                combined, margin=margin, min_pixels=min_pixels,
+                min_lane_pixels=min_lane_pixels,
+            )
+        else:
+            # Extract lane pixels
+            left_pixels, right_pixels = self._extract_lane_pixels(
+                combined, margin=margin, min_pixels=min_pixels
+            )
+            
+            left_poly = self._fit_polynomial(left_pixels) if len(left_pixels[0]) > min_lane_pixels else None
+            right_poly = self._fit_polynomial(right_pixels) if len(right_pixels[0]) > min_lane_pixels else None
         
+        if scale != 1:
+            left_poly = self._rescale_poly(left_poly, scale)
+            right_poly = self._rescale_poly(right_poly, scale)
+        
+        return left_poly, right_poly
+    
+    def _update_state(
+        self,
+        left_poly: Optional[np.ndarray],
+        right_poly: Optional[np.ndarray],
+        img_width: int,
+        img_height: int,
+    ) -> LaneState:
+        """Smooth the latest fits and compute the lane state."""
         # Apply smoothing
         if self.enable_smoothing:
             left_poly = self._smooth_lane(left_poly, self.left_history)
             right_poly = self._smooth_lane(right_poly, self.right_history)
         
         # Compute metrics
-        state = self._compute_metrics(left_poly, right_poly, w, h)
-        
-        return state
+        return self._compute_metrics(left_poly, right_poly, img_width, img_height)
     
     def _compute_perspective(self, w: int, h: int):
         """Compute perspective transform matrices."""
@@ -156,51 +447,125 @@ class LaneKeeping:
         
         self.M = cv2.getPerspectiveTransform(src, dst)
         self.Minv = cv2.getPerspectiveTransform(dst, src)
+        
+        # remap samples src at H^-1 * dst, so each direction uses the other matrix
+        self._warp_maps = self._perspective_maps(self.Minv, self.warped_size)
+        self._unwarp_maps = self._perspective_maps(self.M, (w, h))
+        self._unwarp_size = (w, h)
+    
+    @staticmethod
+    def _perspective_maps(H_inv: np.ndarray, size: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """CV_16SC2 remap tables equivalent to warpPerspective(H) into size (w, h)."""
+        w, h = size
+        u, v = np.meshgrid(np.arange(w, dtype=np.float64), np.arange(h, dtype=np.float64))
+        den = H_inv[2, 0] * u + H_inv[2, 1] * v + H_inv[2, 2]
+        # Points on the horizon map to 0, as in warpPerspective
+        inv = np.divide(1.0, den, out=np.zeros_like(den), where=den != 0)
+        map_x = ((H_inv[0, 0] * u + H_inv[0, 1] * v + H_inv[0, 2]) * inv).astype(np.float32)
+        map_y = ((H_inv[1, 0] * u + H_inv[1, 1] * v + H_inv[1, 2]) * inv).astype(np.float32)
+        return cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+    
+    def _allocate_buffers(self):
+        """Allocate the warp-stage buffers reused across frames."""
+        ww, wh = self.warped_size
+        self._warped = np.empty((wh, ww, 3), dtype=np.uint8)
+        self._warped_half = np.empty(((wh + 1) // 2, (ww + 1) // 2, 3), dtype=np.uint8)
+    
+    def _allocate_mask_buffers(self, h: int, w: int):
+        """Allocate the mask-stage buffers for an h x w working image."""
+        self._hls = np.empty((h, w, 3), dtype=np.uint8)
+        self._gray = np.empty((h, w), dtype=np.uint8)
+        self._sobelx = np.empty((h, w), dtype=np.int16)
+        self._combined = np.empty((h, w), dtype=np.uint8)
+    
+    def _allocate_draw_buffers(self):
+        """Allocate the draw_lane overlay and polygon buffers."""
+        ww, wh = self.warped_size
+        self._lane_img = np.empty((wh, ww, 3), dtype=np.uint8)
+        self._y_points = np.linspace(0, wh - 1, 50)
+        # Vandermonde rows [y^2, y, 1]: each curve is one (50x3) @ (3,) product
+        self._Y50 = np.stack(
+            [self._y_points**2, self._y_points, np.ones_like(self._y_points)], axis=1
+        )
+        self._x_buf = np.empty(len(self._y_points))
+        self._pts_buf = np.empty((100, 2), dtype=np.int32)
+        self._pts_buf[:50, 1] = self._y_points
+        self._pts_buf[50:, 1] = self._y_points[::-1]
+    
+    @staticmethod
+    def _rescale_poly(poly: Optional[np.ndarray], scale: int) -> Optional[np.ndarray]:
+        """Map x = a*y^2 + b*y + c fitted on a 1/scale image to full size."""
+        if poly is None:
+            return None
+        return poly * np.array([1.0 / scale, 1.0, scale])
     
     def _extract_lane_pixels(
         self,
-        warped: np.ndarray
+        combined: np.ndarray,
+        margin: int = 50,
+        min_pixels: int = 50,
     ) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
-        """Extract lane pixels using color and gradient thresholds."""
-        # Convert to different color spaces
-        hls = cv2.cvtColor(warped, cv2.COLOR_BGR2HLS)
-        lab = cv2.cvtColor(warped, cv2.COLOR_BGR2LAB)
-        gray = cv2.cvtColor(warped, cv2.COLOR_BGR2GRAY)
+        """Extract left/right lane pixels from the lane mask."""
+        # Split into left and right halves
+        midpoint = combined.shape[1] // 2
         
-        # S channel (saturation) - good for colored lanes
-        s_channel = hls[:, :, 2]
-        s_binary = np.zeros_like(s_channel)
-        s_binary[(s_channel >= 100) & (s_channel <= 255)] = 1
+        # Use sliding window to find lane pixels
+        left_pixels = self._sliding_window_search(
+            combined[:, :midpoint], margin=margin, min_pixels=min_pixels, offset=0
+        )
+        right_pixels = self._sliding_window_search(
+            combined[:, midpoint:], margin=margin, min_pixels=min_pixels, offset=midpoint
+        )
         
-        # B channel (LAB) - good for yellow
-        b_channel = lab[:, :, 2]
-        b_binary = np.zeros_like(b_channel)
-        b_binary[(b_channel >= 145) & (b_channel <= 200)] = 1
+        return left_pixels, right_pixels
+    
+    def _lane_mask(self, warped: np.ndarray) -> np.ndarray:
+        """Combined 0/255 lane mask from color and gradient thresholds."""
+        if self._gray is None or self._gray.shape != warped.shape[:2]:
+            self._allocate_mask_buffers(*warped.shape[:2])
+        
+        if self.color_lut:
+            # Colors come from the LUT, so only grayscale is needed
+            gray = cv2.cvtColor(warped, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        else:
+            # One color conversion; the L channel stands in for grayscale.
+            # Plain BGR2HLS on purpose: the _FULL variant rounds L/S
+            # differently and its 0-255 hue would need the yellow band rescaled.
+            hls = cv2.cvtColor(warped, cv2.COLOR_BGR2HLS, dst=self._hls)
+            gray = cv2.extractChannel(hls, 1, dst=self._gray)
+        
+        # Gradient (Sobel X); 16-bit holds the full 3x3 range of 8-bit input
+        sobelx = cv2.Sobel(gray, cv2.CV_16S, 1, 0, dst=self._sobelx, ksize=3)
+        
+        if _lane_mask_kernel is not None:
+            if self.color_lut:
+                _lane_mask_lut_kernel(warped, _COLOR_LUT, sobelx, self._combined)
+            else:
+                _lane_mask_kernel(hls, sobelx, self._combined)
+            return self._combined
         
-        # L channel (lightness) - good for white lanes
-        l_channel = hls[:, :, 1]
-        l_binary = np.zeros_like(l_channel)
-        l_binary[(l_channel >= 200) & (l_channel <= 255)] = 1
+        # Gradient threshold on |Sobel|, kept in int16
+        abs_sobel = cv2.absdiff(sobelx, 0, dst=sobelx)
+        sobel_binary = cv2.inRange(abs_sobel, _SOBEL_MIN, _SOBEL_MAX)
         
-        # Gradient (Sobel X)
-        sobelx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        abs_sobelx = np.absolute(sobelx)
-        scaled_sobel = np.uint8(255 * abs_sobelx / np.max(abs_sobelx))
-        sobel_binary = np.zeros_like(scaled_sobel)
-        sobel_binary[(scaled_sobel >= 30) & (scaled_sobel <= 150)] = 1
+        if self.color_lut:
+            return cv2.bitwise_or(_color_lut_mask(warped), sobel_binary, dst=self._combined)
         
-        # Combine all
-        combined = np.zeros_like(gray)
-        combined[(s_binary == 1) | (l_binary == 1) | (b_binary == 1) | (sobel_binary == 1)] = 1
+        # S channel (saturation) - good for colored lanes
+        s_binary = cv2.inRange(hls, (0, 0, 100), (255, 255, 255))
         
-        # Split into left and right halves
-        midpoint = combined.shape[1] // 2
+        # Yellow hue with moderate saturation (replaces the LAB B channel)
+        y_binary = cv2.inRange(hls, (15, 0, 80), (35, 255, 255))
         
-        # Use sliding window to find lane pixels
-        left_pixels = self._sliding_window_search(combined[:, :midpoint], offset=0)
-        right_pixels = self._sliding_window_search(combined[:, midpoint:], offset=midpoint)
+        # L channel (lightness) - good for white lanes
+        l_binary = cv2.inRange(gray, 200, 255)
         
-        return left_pixels, right_pixels
+        # Combine all
+        combined = cv2.bitwise_or(s_binary, l_binary, dst=self._combined)
+        cv2.bitwise_or(combined, y_binary, dst=combined)
+        cv2.bitwise_or(combined, sobel_binary, dst=combined)
+        
+        return combined
     
     def _sliding_window_search(
         self,
@@ -213,8 +578,16 @@ class LaneKeeping:
         """Find lane pixels using sliding window search."""
         h, w = binary.shape
         
+        # Integral images of the 0/1 mask and of column-weighted mask give
+        # O(1) pixel counts and x-centroids for any window
+        ones = np.minimum(binary, 1)
+        ii = cv2.integral(ones)
+        weighted = np.multiply(ones, np.arange(w, dtype=np.uint16), dtype=np.uint16)
+        iix = cv2.integral(weighted, sdepth=cv2.CV_64F)
+        
         # Find starting point from histogram of bottom quarter
-        histogram = np.sum(binary[3*h//4:, :], axis=0)
+        y0 = 3*h//4
+        histogram = np.diff(ii[h] - ii[y0])
         if np.max(histogram) == 0:
             return (np.array([]), np.array([]))
         
@@ -225,7 +598,7 @@ class LaneKeeping:
         # Current position
         current = base
         
-        lane_inds = []
+        xs, ys = [], []
         
         for window in range(n_windows):
             # Window boundaries
@@ -234,34 +607,48 @@ class LaneKeeping:
             win_x_low = max(0, current - margin)
             win_x_high = min(w, current + margin)
             
-            # Find nonzero pixels in window
-            nonzero = binary.nonzero()
-            nonzeroy = np.array(nonzero[0])
-            nonzerox = np.array(nonzero[1])
+            # Count pixels in window
+            count = (ii[win_y_high, win_x_high] - ii[win_y_low, win_x_high]
+                     - ii[win_y_high, win_x_low] + ii[win_y_low, win_x_low])
+            if count == 0:
+                continue
             
-            good_inds = (
-                (nonzeroy >= win_y_low) & (nonzeroy < win_y_high) &
-                (nonzerox >= win_x_low) & (nonzerox < win_x_high)
-            ).nonzero()[0]
-            
-            lane_inds.append(good_inds)
+            # Collect window pixels (only the window itself is scanned)
+            wy, wx = binary[win_y_low:win_y_high, win_x_low:win_x_high].nonzero()
+            ys.append(wy + win_y_low)
+            xs.append(wx + win_x_low)
             
             # Recenter next window
-            if len(good_inds) > min_pixels:
-                current = int(np.mean(nonzerox[good_inds]))
-        
-        # Concatenate indices
-        lane_inds = np.concatenate(lane_inds) if lane_inds else np.array([])
+            if count > min_pixels:
+                sum_x = (iix[win_y_high, win_x_high] - iix[win_y_low, win_x_high]
+                         - iix[win_y_high, win_x_low] + iix[win_y_low, win_x_low])
+                current = int(sum_x / count)
         
-        if len(lane_inds) == 0:
+        if not xs:
             return (np.array([]), np.array([]))
         
-        nonzero = binary.nonzero()
-        x = nonzero[1][lane_inds] + offset
-        y = nonzero[0][lane_inds]
+        x = np.concatenate(xs) + offset
+        y = np.concatenate(ys)
         
         return (x, y)
     
+    def _fit_lanes_jit(
+        self,
+        combined: np.ndarray,
+        n_windows: int = 9,
+        margin: int = 50,
+        min_pixels: int = 50,
+        min_lane_pixels: int = 100,
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Sliding-window search + quadratic fit of both halves via numba."""
+        midpoint = combined.shape[1] // 2
+        polys = []
+        for half, offset in ((combined[:, :midpoint], 0), (combined[:, midpoint:], midpoint)):
+            coef = np.empty(3, dtype=np.float64)
+            n = _fit_lane_kernel(half, offset, n_windows, margin, min_pixels, coef)
+            polys.append(coef if n > min_lane_pixels else None)
+        return polys[0], polys[1]
+    
     def _fit_polynomial(
         self,
         pixels: Tuple[np.ndarray, np.ndarray],
@@ -274,29 +661,66 @@ class LaneKeeping:
             return None
         
         try:
-            # Fit x = f(y) (2nd degree polynomial)
+            if degree == 2:
+                return self._fit_poly2(x, y)
+            # Fit x = f(y) (general degree)
             coeffs = np.polyfit(y, x, degree)
             return coeffs
         except (np.RankWarning, np.linalg.LinAlgError):
             return None
     
+    @staticmethod
+    def _fit_poly2(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Least-squares x = a*y^2 + b*y + c via the 3x3 normal equations.
+        
+        y is centered and scaled first to keep the moment matrix well
+        conditioned; the coefficients are mapped back afterwards.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        m = y.mean()
+        s = max(float(np.ptp(y)), 1.0)
+        t = (y - m) / s
+        t2 = t * t
+        
+        s1, s2 = t.sum(), t2.sum()
+        s3, s4 = t2.dot(t), t2.dot(t2)
+        A = np.array([[s4, s3, s2], [s3, s2, s1], [s2, s1, len(t)]])
+        rhs = np.array([t2.dot(x), t.dot(x), x.sum()])
+        pa, pb, pc = np.linalg.solve(A, rhs)
+        
+        # Undo t = (y - m) / s
+        a = pa / (s * s)
+        b = pb / s - 2 * a * m
+        c = pc - pb * m / s + a * m * m
+        return np.array([a, b, c])
+    
     def _smooth_lane(
         self,
         poly: Optional[np.ndarray],
-        history: List[np.ndarray],
+        history: LaneHistory,
     ) -> Optional[np.ndarray]:
         """Apply temporal smoothing to lane polynomial."""
         if poly is not None:
-            history.append(poly)
-        
-        if len(history) > self.history_size:
-            history.pop(0)
-        
-        if not history:
+            # Replace the oldest slot, keeping the running sum in step
+            slot = history.buf[history.head]
+            if history.count == len(history.buf):
+                history.total -= slot
+            else:
+                history.count += 1
+            slot[:] = poly
+            history.total += slot
+            history.head = (history.head + 1) % len(history.buf)
+            if history.head == 0:
+                # Resync once per lap so add/subtract rounding cannot drift
+                history.buf[:history.count].sum(axis=0, out=history.total)
+        
+        if history.count == 0:
             return None
         
         # Average coefficients
-        return np.mean(history, axis=0)
+        return history.total / history.count
     
     def _compute_metrics(
         self,
@@ -329,8 +753,8 @@ class LaneKeeping:
         y_eval = wh - 1
         
         if left_poly is not None and right_poly is not None:
-            left_x = np.polyval(left_poly, y_eval)
-            right_x = np.polyval(right_poly, y_eval)
+            left_x = _poly2(left_poly, y_eval)
+            right_x = _poly2(right_poly, y_eval)
             
             lane_center = (left_x + right_x) / 2
             img_center = ww / 2
@@ -345,21 +769,22 @@ class LaneKeeping:
             # Compute center polynomial
             state.center_poly = (left_poly + right_poly) / 2
             
-            # Compute curvature
-            state.curvature_radius = self._compute_curvature(state.center_poly, y_eval)
-            
-            # Compute heading angle
-            state.heading_angle = self._compute_heading(state.center_poly, y_eval)
+            # Curvature and heading share the slope at y_eval; evaluate it once
+            coeffs = state.center_poly.tolist()
+            d1 = 2 * coeffs[0] * y_eval + coeffs[1]
+            state.heading_angle = math.degrees(math.atan(d1))
+            if len(coeffs) >= 3:
+                state.curvature_radius = self._curvature_from_slope(d1, 2 * coeffs[0])
         
         elif left_poly is not None:
             # Only left lane visible
-            left_x = np.polyval(left_poly, y_eval)
+            left_x = _poly2(left_poly, y_eval)
             estimated_center = left_x + self.ppm_bottom * self.DEFAULT_LANE_WIDTH / 2
             state.center_offset = (ww / 2 - estimated_center) / self.ppm_bottom
         
         elif right_poly is not None:
             # Only right lane visible
-            right_x = np.polyval(right_poly, y_eval)
+            right_x = _poly2(right_poly, y_eval)
             estimated_center = right_x - self.ppm_bottom * self.DEFAULT_LANE_WIDTH / 2
             state.center_offset = (ww / 2 - estimated_center) / self.ppm_bottom
         
@@ -377,55 +802,27 @@ class LaneKeeping:
         else:
             state.departure_status = LaneDepartureStatus.CENTERED
         
-        # Compute suggested steering
-        state.suggested_steering = self._compute_steering(state)
+        # Suggested steering: simple P controller, clamped to -45..45 degrees
+        steering = (
+            self.KP_OFFSET * state.center_offset + self.KP_HEADING * state.heading_angle
+        )
+        state.suggested_steering = min(max(steering, -45.0), 45.0)
         
         return state
     
-    def _compute_curvature(self, poly: np.ndarray, y_eval: float) -> float:
-        """Compute radius of curvature at given y."""
-        if poly is None or len(poly) < 3:
-            return float('inf')
-        
-        # First and second derivatives
-        d1 = 2 * poly[0] * y_eval + poly[1]
-        d2 = 2 * poly[0]
-        
+    def _curvature_from_slope(self, d1: float, d2: float) -> float:
+        """Radius of curvature in meters from the first and second derivatives."""
         if abs(d2) < 1e-6:
             return float('inf')
         
         # Curvature formula: R = (1 + (dx/dy)^2)^(3/2) / |d2x/dy2|
-        curvature = ((1 + d1**2)**1.5) / abs(d2)
+        curvature = ((1 + d1 * d1)**1.5) / abs(d2)
         
         # Scale to meters (rough approximation)
         curvature_m = curvature / self.ppm_bottom
         
         return min(curvature_m, 10000)  # Cap at 10km
     
-    def _compute_heading(self, poly: np.ndarray, y_eval: float) -> float:
-        """Compute heading angle relative to lane."""
-        if poly is None or len(poly) < 2:
-            return 0.0
-        
-        # Slope at evaluation point (dx/dy)
-        slope = 2 * poly[0] * y_eval + poly[1]
-        
-        # Convert to angle (in degrees)
-        angle = np.arctan(slope) * 180 / np.pi
-        
-        return angle
-    
-    def _compute_steering(self, state: LaneState) -> float:
-        """Compute suggested steering angle."""
-        # Simple P controller
-        kp_offset = 2.0  # Gain for center offset
-        kp_heading = 0.5  # Gain for heading angle
-        
-        steering = kp_offset * state.center_offset + kp_heading * state.heading_angle
-        
-        # Clamp to reasonable range (-45 to 45 degrees)
-        return np.clip(steering, -45, 45)
-    
     def draw_lane(
         self,
         frame: np.ndarray,
@@ -455,20 +852,21 @@ class LaneKeeping:
             return output
         
         # Create warped lane image
-        lane_img = np.zeros((self.warped_size[1], self.warped_size[0], 3), dtype=np.uint8)
-        
-        # Generate y points
-        y_points = np.linspace(0, self.warped_size[1] - 1, 50)
+        if self._lane_img is None:
+            self._allocate_draw_buffers()
+        lane_img = self._lane_img
+        lane_img.fill(0)
+        
+        pts = self._pts_buf
+        n = len(self._y_points)
+        left_pts, right_pts = pts[:n], pts[n:]
+        if state.left_poly is not None:
+            left_pts[:, 0] = np.matmul(self._Y50, state.left_poly, out=self._x_buf)
+        if state.right_poly is not None:
+            right_pts[::-1, 0] = np.matmul(self._Y50, state.right_poly, out=self._x_buf)
         
         # Draw lane area
         if state.left_poly is not None and state.right_poly is not None:
-            left_x = np.polyval(state.left_poly, y_points)
-            right_x = np.polyval(state.right_poly, y_points)
-            
-            pts_left = np.column_stack((left_x, y_points))
-            pts_right = np.column_stack((right_x, y_points))[::-1]
-            pts = np.vstack((pts_left, pts_right)).astype(np.int32)
-            
             # Color based on departure status
             if state.departure_status in [LaneDepartureStatus.DEPARTED_LEFT, 
                                           LaneDepartureStatus.DEPARTED_RIGHT]:
@@ -482,15 +880,16 @@ class LaneKeeping:
             cv2.fillPoly(lane_img, [pts], color)
         
         # Draw lane lines
-        for poly, color in [(state.left_poly, (255, 255, 0)), 
-                           (state.right_poly, (255, 255, 0))]:
+        for poly, line_pts, color in [(state.left_poly, left_pts, (255, 255, 0)), 
+                                      (state.right_poly, right_pts, (255, 255, 0))]:
             if poly is not None:
-                x_points = np.polyval(poly, y_points)
-                pts = np.column_stack((x_points, y_points)).astype(np.int32)
-                cv2.polylines(lane_img, [pts], False, color, 3)
+                cv2.polylines(lane_img, [line_pts], False, color, 3)
         
         # Unwarp back to original perspective
-        unwarped = cv2.warpPerspective(lane_img, self.Minv, (w, h))
+        if self._unwarp_size == (w, h):
+            unwarped = cv2.remap(lane_img, *self._unwarp_maps, cv2.INTER_LINEAR)
+        else:
+            unwarped = cv2.warpPerspective(lane_img, self.Minv, (w, h))
         output = cv2.addWeighted(output, 0.8, unwarped, 0.3, 0)
         
         # Draw info panel
@@ -528,6 +927,82 @@ class LaneKeeping:
         return output
 
 
+class LaneKeepingGPU(LaneKeeping):
+    """
+    Lane Keeping Assist with the image stages (warp, color conversion,
+    Sobel, thresholds) batched on the GPU via Kornia.
+    
+    Window search, fitting and smoothing stay on the CPU: they are
+    sequential per frame and only touch the small binary mask.
+    """
+    
+    def __init__(self, *args, device: str = "cuda", **kwargs):
+        if torch is None or kornia is None:
+            raise ImportError("LaneKeepingGPU requires torch and kornia")
+        super().__init__(*args, **kwargs)
+        self.device = torch.device(device)
+        self._M_t = None
+    
+    def detect(self, frame: np.ndarray) -> LaneState:
+        """Detect lanes in a single BGR frame."""
+        return self.detect_batch([frame])[0]
+    
+    def detect_batch(self, frames: List[np.ndarray]) -> List[LaneState]:
+        """
+        Detect lanes in consecutive frames from one camera.
+        
+        Args:
+            frames: Same-sized BGR images, oldest first
+            
+        Returns:
+            LaneState per frame, smoothed in order as with detect()
+        """
+        h, w = frames[0].shape[:2]
+        
+        if self.M is None:
+            self._compute_perspective(w, h)
+        if self._M_t is None:
+            self._M_t = torch.from_numpy(self.M).float().to(self.device)
+        
+        states = []
+        for combined in self._lane_masks_gpu(frames):
+            left_poly, right_poly = self._fit_lanes(combined)
+            states.append(self._update_state(left_poly, right_poly, w, h))
+        return states
+    
+    def _lane_masks_gpu(self, frames: List[np.ndarray]) -> np.ndarray:
+        """Warp and threshold a batch of BGR frames; returns (N, H, W) 0/255 masks."""
+        n = len(frames)
+        batch = torch.from_numpy(np.stack(frames)).to(self.device)
+        
+        # BGR uint8 NHWC -> RGB float NCHW in [0, 1]
+        rgb = batch.flip(-1).permute(0, 3, 1, 2).float().div_(255.0)
+        
+        ww, wh = self.warped_size
+        warped = kornia.geometry.transform.warp_perspective(
+            rgb, self._M_t.expand(n, 3, 3), (wh, ww), align_corners=True
+        )
+        if self.half_resolution:
+            warped = kornia.geometry.transform.pyrdown(warped)
+        
+        # Kornia HLS: hue in radians, L and S in [0, 1]. Thresholds match
+        # the 8-bit OpenCV ones used by _lane_mask.
+        hls = kornia.color.rgb_to_hls(warped)
+        hue = torch.rad2deg(hls[:, 0])
+        light = hls[:, 1:2]
+        sat = hls[:, 2] * 255.0
+        
+        mask = (sat >= 99.5) | (light[:, 0] * 255.0 >= 199.5)
+        mask |= (sat >= 79.5) & (hue >= 29.0) & (hue < 71.0)
+        
+        # Sobel X on L, in 8-bit units
+        sobelx = kornia.filters.spatial_gradient(light, mode="sobel", normalized=False)[:, 0, 0]
+        sobelx = sobelx.abs().mul_(255.0)
+        mask |= (sobelx >= _SOBEL_MIN) & (sobelx <= _SOBEL_MAX)
+        
+        return mask.to(torch.uint8).mul_(255).cpu().numpy()
+
+
 # ============================================================================
 # Testing
 # ============================================================================
@@ -557,4 +1032,15 @@ if __name__ == "__main__":
     # Draw result
     result = lka.draw_lane(test_img, state)
     
+    # Kornia path on the same frame (CPU tensors when no GPU is present)
+    if torch is not None and kornia is not None:
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        gpu_state = LaneKeepingGPU(device=device).detect(test_img)
+        print(f"\nLaneKeepingGPU ({device}):")
+        print(f"  Confidence: {gpu_state.confidence:.2f}")
+        print(f"  Center Offset: {gpu_state.center_offset:.2f}m")
+        print(f"  Status: {gpu_state.departure_status.value}")
+    else:
+        print("\nLaneKeepingGPU skipped (torch/kornia not installed)")
+    
     print("\n✅ Test complete!")
@@ -10,13 +10,181 @@ Features:
 - Scene filtering and downsampling
 """
 
+import os
 import numpy as np
 import struct
-import json
-from typing import Tuple, Optional, List
+from functools import cached_property
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Tuple, Optional, List
 from dataclasses import dataclass
 from pathlib import Path
 
+try:
+    from numba import njit, prange
+except ImportError:  # Optional JIT; falls back to NumPy
+    njit = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # Optional; estimate_normals falls back to camera-facing normals
+    cKDTree = None
+
+try:
+    import torch
+except ImportError:  # Optional GPU back-projection for torch depth tensors
+    torch = None
+
+
+def _backproject_loop(depth, ux, vy, depth_scale, max_depth, out_xyz, out_mask):
+    """
+    Single pass over a normalized depth map writing metric XYZ per pixel
+    (X = ux[j] * Z, Y = vy[i] * Z) and whether its depth lies strictly
+    inside (0.1, max_depth).
+    """
+    h, w = depth.shape
+    for i in prange(h):
+        for j in range(w):
+            d = depth[i, j]
+            z = depth_scale / d if d > 0.01 else max_depth
+            z = min(max(z, 0.1), max_depth)
+            
+            out_xyz[i, j, 0] = ux[j] * z
+            out_xyz[i, j, 1] = vy[i] * z
+            out_xyz[i, j, 2] = z
+            out_mask[i, j] = z > 0.1 and z < max_depth
+
+
+_backproject_kernel = (
+    njit(parallel=True, fastmath=True, cache=__name__ != "__main__")(_backproject_loop)
+    if njit is not None else None
+)
+
+
+def _count_faces_loop(valid, row_counts):
+    """Triangles emitted per quad row of a validity grid (first pass)."""
+    h, w = valid.shape
+    for i in prange(h - 1):
+        n = 0
+        for j in range(w - 1):
+            v2 = valid[i, j + 1]
+            v3 = valid[i + 1, j]
+            if v2 and v3:
+                n += valid[i, j] + valid[i + 1, j + 1]
+        row_counts[i] = n
+
+
+def _emit_faces_loop(valid, row_offsets, faces_out):
+    """
+    Second pass: each quad row writes its triangles from its precomputed
+    offset, in the same row-major, triangle-interleaved order as the NumPy
+    path, so rows can run in parallel without atomics.
+    """
+    h, w = valid.shape
+    for i in prange(h - 1):
+        k = row_offsets[i]
+        for j in range(w - 1):
+            if not (valid[i, j + 1] and valid[i + 1, j]):
+                continue
+            idx = i * w + j
+            if valid[i, j]:
+                faces_out[k, 0] = idx
+                faces_out[k, 1] = idx + 1
+                faces_out[k, 2] = idx + w
+                k += 1
+            if valid[i + 1, j + 1]:
+                faces_out[k, 0] = idx + 1
+                faces_out[k, 1] = idx + w + 1
+                faces_out[k, 2] = idx + w
+                k += 1
+
+
+if njit is not None:
+    _jit = njit(parallel=True, cache=__name__ != "__main__")
+    _count_faces_kernel = _jit(_count_faces_loop)
+    _emit_faces_kernel = _jit(_emit_faces_loop)
+else:
+    _count_faces_kernel = _emit_faces_kernel = None
+
+
+# 256x3 RGB inferno colormap (see _inferno_lut)
+_INFERNO_LUT: Optional[np.ndarray] = None
+
+
+def _inferno_lut() -> np.ndarray:
+    """
+    RGB inferno lookup table, sampled once from OpenCV's COLORMAP_INFERNO so
+    per-frame coloring is a single gather with no BGR->RGB copy.
+    """
+    global _INFERNO_LUT
+    if _INFERNO_LUT is None:
+        import cv2
+        ramp = np.arange(256, dtype=np.uint8).reshape(-1, 1)
+        bgr = cv2.applyColorMap(ramp, cv2.COLORMAP_INFERNO)
+        _INFERNO_LUT = np.ascontiguousarray(bgr[:, 0, ::-1])
+    return _INFERNO_LUT
+
+
+def _write_segments(filepath, segments) -> None:
+    """
+    Write contiguous buffers to a file back to back, with scatter-gather
+    os.writev where available so nothing is concatenated in memory.
+    """
+    if not hasattr(os, "writev"):  # e.g. Windows
+        with open(filepath, 'wb') as f:
+            for segment in segments:
+                f.write(segment)
+        return
+    
+    views = [memoryview(seg).cast('B') for seg in segments]
+    views = [v for v in views if v.nbytes]
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while views:
+            written = os.writev(fd, views)
+            # Short write: drop the finished segments, resume mid-segment
+            while views and written >= views[0].nbytes:
+                written -= views[0].nbytes
+                views.pop(0)
+            if written:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+
+
+# Interleaved point record (same byte layout as a colored binary PLY vertex),
+# so points and colors are filtered together with a single boolean gather
+_POINT_DTYPE = np.dtype([('xyz', '<f4', 3), ('rgb', 'u1', 3)])
+
+
+# GLB scene description with %-placeholders for the per-mesh counts, bounds
+# and buffer layout (the structure never changes, so no dict + json.dumps)
+_GLTF_PREFIX = (
+    '{"asset":{"version":"2.0","generator":"DepthAnything_SceneReconstruction"},'
+    '"scene":0,"scenes":[{"nodes":[0]}],"nodes":[{"mesh":0}],'
+)
+_GLTF_TEMPLATE = _GLTF_PREFIX + (
+    '"meshes":[{"primitives":[{"attributes":{"POSITION":0},"indices":1,"mode":4}]}],'
+    '"accessors":['
+    '{"bufferView":0,"componentType":5126,"count":%d,"type":"VEC3","min":%s,"max":%s},'
+    '{"bufferView":1,"componentType":5125,"count":%d,"type":"SCALAR"}],'
+    '"bufferViews":['
+    '{"buffer":0,"byteOffset":%d,"byteLength":%d},'
+    '{"buffer":0,"byteOffset":%d,"byteLength":%d}],'
+    '"buffers":[{"byteLength":%d}]}'
+)
+_GLTF_TEMPLATE_COLOR = _GLTF_PREFIX + (
+    '"meshes":[{"primitives":[{"attributes":{"POSITION":0,"COLOR_0":2},"indices":1,"mode":4}]}],'
+    '"accessors":['
+    '{"bufferView":0,"componentType":5126,"count":%d,"type":"VEC3","min":%s,"max":%s},'
+    '{"bufferView":1,"componentType":5125,"count":%d,"type":"SCALAR"},'
+    '{"bufferView":2,"componentType":5126,"count":%d,"type":"VEC3"}],'
+    '"bufferViews":['
+    '{"buffer":0,"byteOffset":%d,"byteLength":%d},'
+    '{"buffer":0,"byteOffset":%d,"byteLength":%d},'
+    '{"buffer":0,"byteOffset":%d,"byteLength":%d}],'
+    '"buffers":[{"byteLength":%d}]}'
+)
+
 
 @dataclass
 class PointCloud:
@@ -29,9 +197,16 @@ class PointCloud:
     def num_points(self) -> int:
         return len(self.points)
     
-    @property
+    def __setattr__(self, name, value):
+        # Assigning new points invalidates the cached bounds (in-place edits
+        # of the array are not tracked)
+        if name == "points":
+            self.__dict__.pop("bounds", None)
+        super().__setattr__(name, value)
+    
+    @cached_property
     def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
-        """Get min/max bounds."""
+        """Get min/max bounds (computed once per points array)."""
         if len(self.points) == 0:
             return np.zeros(3), np.zeros(3)
         return self.points.min(axis=0), self.points.max(axis=0)
@@ -54,6 +229,7 @@ class SceneReconstruction:
         depth_scale: float = 10.0,  # Depth scaling factor
         max_depth: float = 50.0,  # Maximum depth in meters
         downsample_factor: int = 4,  # Spatial downsampling
+        device: str = "auto",  # Torch device for tensor depth maps
     ):
         """
         Initialize scene reconstruction.
@@ -64,6 +240,8 @@ class SceneReconstruction:
             depth_scale: Scale for converting normalized depth
             max_depth: Maximum depth to include
             downsample_factor: Spatial downsampling (1 = full resolution)
+            device: Torch device used when depth maps arrive as tensors
+                ("auto" = CUDA if available, else CPU)
         """
         self.fx = fx
         self.fy = fy
@@ -72,6 +250,19 @@ class SceneReconstruction:
         self.depth_scale = depth_scale
         self.max_depth = max_depth
         self.downsample = downsample_factor
+        
+        # Per-column / per-row ray slopes, keyed on grid size and intrinsics
+        self._ray_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        
+        if device == "auto":
+            device = "cuda" if torch is not None and torch.cuda.is_available() else "cpu"
+        self.device = device
+        self._torch_ray_cache: Dict[tuple, tuple] = {}
+        
+        # Background file export for reconstruct_from_video_frame
+        self._export_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scene-export")
+        self._pending_exports: List[Future] = []
+        self._output_path: Optional[Path] = None
     
     def depth_to_pointcloud(
         self,
@@ -91,6 +282,68 @@ class SceneReconstruction:
         Returns:
             PointCloud object
         """
+        records = None
+        if filter_points and (
+            rgb_image is None and use_colormap
+            or rgb_image is not None and rgb_image.dtype == np.uint8
+        ):
+            # Write points and colors interleaved so one gather filters both
+            if torch is not None and isinstance(depth_map, torch.Tensor):
+                h, w = depth_map.shape[-2:]
+            else:
+                h, w = depth_map.shape[:2]
+            step = self.downsample
+            records = np.empty(-(-h // step) * -(-w // step), dtype=_POINT_DTYPE)
+        
+        points, valid, colors = self._backproject_full(
+            depth_map, rgb_image, use_colormap, out=records
+        )
+        
+        # Filter out invalid points (too far or at edge)
+        if records is not None:
+            kept = records[valid.ravel()]
+            return PointCloud(points=kept['xyz'], colors=kept['rgb'])
+        
+        points = points.reshape(-1, 3)
+        if filter_points:
+            valid = valid.ravel()
+            points = points[valid]
+            if colors is not None:
+                colors = colors[valid]
+        
+        return PointCloud(points=points, colors=colors)
+    
+    def _backproject_full(
+        self,
+        depth_map: np.ndarray,
+        rgb_image: Optional[np.ndarray] = None,
+        use_colormap: bool = True,
+        out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """
+        Back-project the (downsampled) depth grid without filtering.
+        
+        If out (an H*W _POINT_DTYPE array) is given, points and colors are
+        written into its fields and returned as views of it.
+        
+        Returns:
+            points: HxWx3 metric XYZ per grid pixel
+            valid: HxW mask of depths inside (0.1, max_depth)
+            colors: (H*W)x3 RGB per grid pixel, or None
+        """
+        if torch is not None and isinstance(depth_map, torch.Tensor):
+            points, valid, depth_map = self._backproject_torch(depth_map)
+            if rgb_image is not None and self.downsample > 1:
+                rgb_image = rgb_image[::self.downsample, ::self.downsample]
+            if out is not None:
+                out['xyz'] = points.reshape(-1, 3)
+                points = out['xyz'].reshape(points.shape)
+            colors = self._grid_colors(
+                depth_map, rgb_image, use_colormap,
+                out=out['rgb'] if out is not None else None,
+            )
+            return points, valid, colors
+        
         h, w = depth_map.shape[:2]
         
         # Downsample
@@ -100,83 +353,177 @@ class SceneReconstruction:
                 rgb_image = rgb_image[::self.downsample, ::self.downsample]
             h, w = depth_map.shape[:2]
         
-        # Update principal point for downsampled image
-        cx = self.cx / self.downsample
-        cy = self.cy / self.downsample
-        fx = self.fx / self.downsample
-        fy = self.fy / self.downsample
-        
-        # Create pixel coordinate grids
-        u, v = np.meshgrid(np.arange(w), np.arange(h))
-        
-        # Convert normalized depth to metric depth
-        # Inverse relationship: higher value = closer = smaller Z
-        metric_depth = np.where(
-            depth_map > 0.01,
-            self.depth_scale / depth_map,
-            self.max_depth
-        )
-        
-        # Clip to valid range
-        metric_depth = np.clip(metric_depth, 0.1, self.max_depth)
-        
-        # Back-project to 3D
-        # X = (u - cx) * Z / fx
-        # Y = (v - cy) * Z / fy
-        # Z = depth
-        z = metric_depth
-        x = (u - cx) * z / fx
-        y = (v - cy) * z / fy
-        
-        # Stack into Nx3 array
-        points = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+        # float32 throughout: half the memory traffic of float64, and the
+        # exporters write float32 anyway
+        depth_map = depth_map.astype(np.float32, copy=False)
+        ux, vy = self._pixel_rays(h, w)
+        
+        if _backproject_kernel is not None:
+            # Fused metric depth + back-projection + validity in one pass
+            if out is not None:
+                points = out['xyz'].reshape(h, w, 3)
+            else:
+                points = np.empty((h, w, 3), dtype=np.float32)
+            valid = np.empty((h, w), dtype=np.bool_)
+            _backproject_kernel(
+                depth_map, ux, vy,
+                self.depth_scale, self.max_depth, points, valid,
+            )
+        else:
+            # Convert normalized depth to metric depth
+            # Inverse relationship: higher value = closer = smaller Z
+            floor = self.depth_scale / self.max_depth
+            if floor >= 0.01:
+                # Branchless: flooring the input at depth_scale / max_depth
+                # maps every d <= 0.01 to max_depth, like the where below
+                metric_depth = np.maximum(depth_map, np.float32(floor))
+                np.divide(np.float32(self.depth_scale), metric_depth, out=metric_depth)
+            else:
+                metric_depth = np.where(
+                    depth_map > 0.01,
+                    self.depth_scale / depth_map,
+                    self.max_depth
+                ).astype(np.float32, copy=False)
+            
+            # Clip to valid range
+            np.clip(metric_depth, 0.1, self.max_depth, out=metric_depth)
+            
+            # Back-project to 3D
+            # X = (u - cx) / fx * Z
+            # Y = (v - cy) / fy * Z
+            # Z = depth
+            z = metric_depth
+            x = ux[None, :] * z
+            y = vy[:, None] * z
+            
+            # Stack into HxWx3 grid
+            points = np.stack(
+                [x, y, z], axis=-1,
+                out=out['xyz'].reshape(h, w, 3) if out is not None else None,
+            )
+            valid = (z < self.max_depth) & (z > 0.1)
         
+        colors = self._grid_colors(
+            depth_map, rgb_image, use_colormap,
+            out=out['rgb'] if out is not None else None,
+        )
+        return points, valid, colors
+    
+    @staticmethod
+    def _grid_colors(
+        depth_map: np.ndarray,
+        rgb_image: Optional[np.ndarray],
+        use_colormap: bool,
+        out: Optional[np.ndarray] = None,
+    ) -> Optional[np.ndarray]:
+        """(H*W)x3 RGB colors for a downsampled grid (into out if given), or None."""
         colors = None
         # Get colors
         if rgb_image is not None:
             # Convert BGR to RGB
-            colors = rgb_image[:, :, ::-1].reshape(-1, 3)
+            if out is not None:
+                out.reshape(rgb_image.shape)[...] = rgb_image[:, :, ::-1]
+                colors = out
+            else:
+                colors = rgb_image[:, :, ::-1].reshape(-1, 3)
         
         if use_colormap and colors is None:
-            import cv2
             depth_uint8 = (depth_map * 255).astype(np.uint8)
-            colored = cv2.applyColorMap(depth_uint8, cv2.COLORMAP_INFERNO)
-            colors = colored[:, :, ::-1].reshape(-1, 3)  # BGR to RGB
+            colors = np.take(_inferno_lut(), depth_uint8.ravel(), axis=0, out=out)
         
-        # Filter out invalid points (too far or at edge)
-        if filter_points:
-            mask = (z.flatten() < self.max_depth) & (z.flatten() > 0.1)
-            points = points[mask]
-            if colors is not None:
-                colors = colors[mask]
+        return colors
+    
+    def _backproject_torch(self, depth_map) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Back-project a torch depth tensor on self.device.
         
-        return PointCloud(points=points, colors=colors)
+        The whole per-pixel map runs on the device; only the downsampled
+        grid (points, mask and depth for coloring) is copied to the host.
+        """
+        depth = depth_map.to(self.device, torch.float32)
+        if depth.dim() == 3:
+            depth = depth.squeeze(0)
+        if self.downsample > 1:
+            depth = depth[::self.downsample, ::self.downsample]
+        h, w = depth.shape
+        
+        key = (h, w, str(depth.device))
+        rays = self._torch_ray_cache.get(key)
+        if rays is None:
+            ux, vy = self._pixel_rays(h, w)
+            rays = self._torch_ray_cache[key] = (
+                torch.from_numpy(ux).to(depth.device),
+                torch.from_numpy(vy).to(depth.device)[:, None],
+            )
+        ux, vy = rays
+        
+        z = torch.where(
+            depth > 0.01, self.depth_scale / depth, torch.full_like(depth, self.max_depth)
+        ).clamp_(0.1, self.max_depth)
+        points = torch.stack([ux * z, vy * z, z], dim=-1)
+        valid = (z > 0.1) & (z < self.max_depth)
+        
+        return points.cpu().numpy(), valid.cpu().numpy(), depth.cpu().numpy()
     
-    def estimate_normals(self, cloud: PointCloud) -> PointCloud:
+    def _pixel_rays(self, h: int, w: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ray slopes (u - cx) / fx per column and (v - cy) / fy per row of the
+        downsampled grid. They only change with resolution or intrinsics, so
+        they are computed once and reused across frames.
+        """
+        key = (h, w, self.downsample, self.fx, self.fy, self.cx, self.cy)
+        rays = self._ray_cache.get(key)
+        if rays is None:
+            # Update principal point for downsampled image
+            cx = self.cx / self.downsample
+            cy = self.cy / self.downsample
+            fx = self.fx / self.downsample
+            fy = self.fy / self.downsample
+            
+            ux = ((np.arange(w) - cx) / fx).astype(np.float32)
+            vy = ((np.arange(h) - cy) / fy).astype(np.float32)
+            rays = self._ray_cache[key] = (ux, vy)
+        return rays
+    
+    def estimate_normals(self, cloud: PointCloud, k: int = 16) -> PointCloud:
         """
         Estimate surface normals for point cloud.
         
+        Fits a plane to each point's k nearest neighbors (PCA): the normal is
+        the eigenvector of the neighborhood covariance with the smallest
+        eigenvalue, oriented towards the camera at the origin.
+        
         Args:
             cloud: Input point cloud
+            k: Neighbors per point
             
         Returns:
             Point cloud with normals
         """
-        # Simple cross-product based normal estimation
-        # This is a simplified version - Open3D has better methods
         points = cloud.points
         n = len(points)
         
         if n < 3:
             return cloud
         
-        normals = np.zeros_like(points)
-        
-        # For each point, find nearby points and compute normal
-        # Using simple neighbor differences
-        for i in range(n):
-            # Just point outward for now (simplified)
-            normals[i] = [0, 0, -1]
+        if cKDTree is None:
+            # No KD-tree available: every normal faces the camera
+            normals = np.zeros_like(points)
+            normals[:, 2] = -1
+        else:
+            k = min(k, n)
+            _, idx = cKDTree(points).query(points, k=k)
+            
+            # Batched neighborhood covariance (N, 3, 3) and eigendecomposition
+            nbrs = points[idx]
+            centered = nbrs - nbrs.mean(axis=1, keepdims=True)
+            cov = np.einsum('nki,nkj->nij', centered, centered) / k
+            _, eigvecs = np.linalg.eigh(cov)
+            normals = eigvecs[:, :, 0]
+            
+            # Flip normals pointing away from the camera
+            away = (normals * points).sum(axis=1, keepdims=True) > 0
+            normals = np.where(away, -normals, normals)
         
         return PointCloud(
             points=cloud.points,
@@ -184,6 +531,50 @@ class SceneReconstruction:
             normals=normals
         )
     
+    def voxel_downsample(self, cloud: PointCloud, voxel_size: float = 0.05) -> PointCloud:
+        """
+        Downsample a point cloud to one point per occupied voxel.
+        
+        Each voxel's point is the mean of the points (and colors/normals)
+        that fall inside it.
+        
+        Args:
+            cloud: Input point cloud
+            voxel_size: Voxel edge length in meters
+            
+        Returns:
+            Downsampled point cloud
+        """
+        if cloud.num_points == 0:
+            return cloud
+        
+        # Integer voxel coordinates, packed into one collision-free key
+        keys = np.floor(cloud.points / voxel_size).astype(np.int64)
+        keys -= keys.min(axis=0)
+        dims = keys.max(axis=0) + 1
+        packed = (keys[:, 0] * dims[1] + keys[:, 1]) * dims[2] + keys[:, 2]
+        _, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+        
+        def voxel_mean(values: np.ndarray) -> np.ndarray:
+            return np.stack([
+                np.bincount(inverse, weights=values[:, k], minlength=len(counts))
+                for k in range(values.shape[1])
+            ], axis=1) / counts[:, None]
+        
+        points = voxel_mean(cloud.points).astype(cloud.points.dtype, copy=False)
+        
+        colors = None
+        if cloud.colors is not None:
+            colors = np.rint(voxel_mean(cloud.colors)).astype(cloud.colors.dtype)
+        
+        normals = None
+        if cloud.normals is not None:
+            normals = voxel_mean(cloud.normals)
+            norms = np.linalg.norm(normals, axis=1, keepdims=True)
+            normals = (normals / np.maximum(norms, 1e-12)).astype(cloud.normals.dtype, copy=False)
+        
+        return PointCloud(points=points, colors=colors, normals=normals)
+    
     def create_mesh(
         self,
         depth_map: np.ndarray,
@@ -201,56 +592,55 @@ class SceneReconstruction:
             faces: Mx3 triangle indices
             colors: Nx3 vertex colors
         """
-        h, w = depth_map.shape[:2]
+        # Keep all points to preserve the grid
+        return self._mesh_from_grid(*self._backproject_full(depth_map, rgb_image))
+    
+    def _mesh_from_grid(
+        self,
+        points_grid: np.ndarray,
+        valid: np.ndarray,
+        colors: Optional[np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Triangulate a back-projected grid (see _backproject_full)."""
+        new_h, new_w = valid.shape
+        
+        if _emit_faces_kernel is not None and new_h > 1:
+            # Two passes (count per row, then write at exact offsets) so the
+            # only allocation is the final face array
+            row_counts = np.empty(new_h - 1, dtype=np.int64)
+            _count_faces_kernel(valid, row_counts)
+            row_offsets = np.zeros(new_h - 1, dtype=np.int64)
+            np.cumsum(row_counts[:-1], out=row_offsets[1:])
+            faces = np.empty((int(row_counts.sum()), 3), dtype=np.int32)
+            _emit_faces_kernel(valid, row_offsets, faces)
+            return points_grid.reshape(-1, 3), faces, colors
+        
+        # Per-corner validity views of every grid quad
+        v1 = valid[:-1, :-1]
+        v2 = valid[:-1, 1:]
+        v3 = valid[1:, :-1]
+        v4 = valid[1:, 1:]
+        
+        # Top-left vertex index of each quad
+        idx = (
+            np.arange(new_h - 1, dtype=np.int32)[:, None] * new_w
+            + np.arange(new_w - 1, dtype=np.int32)[None, :]
+        )
         
-        # Downsample
-        step = self.downsample
-        depth_sampled = depth_map[::step, ::step]
-        new_h, new_w = depth_sampled.shape[:2]
+        # Two triangles per quad, kept only if all three vertices are valid;
+        # the (quad, triangle) layout preserves the row-major face order
+        quads = np.stack([
+            np.stack([idx, idx + 1, idx + new_w], axis=-1),
+            np.stack([idx + 1, idx + new_w + 1, idx + new_w], axis=-1),
+        ], axis=2)
+        keep = np.stack([v1 & v2 & v3, v2 & v3 & v4], axis=2)
+        faces = quads[keep]
         
-        if rgb_image is not None:
-            rgb_sampled = rgb_image[::step, ::step]
-        else:
-            rgb_sampled = None
-        
-        # Create point cloud first
-        # Create point cloud first (keep all points to preserve grid)
-        cloud = self.depth_to_pointcloud(depth_map, filter_points=False)
-        
-        # Reshape points to grid
-        points_grid = cloud.points.reshape(new_h, new_w, 3)
-        z_values = points_grid[:, :, 2]
-        
-        # Generate triangle indices
-        faces = []
-        for i in range(new_h - 1):
-            for j in range(new_w - 1):
-                # Check if all vertices in this quad are valid
-                z1 = z_values[i, j]
-                z2 = z_values[i, j+1]
-                z3 = z_values[i+1, j]
-                z4 = z_values[i+1, j+1]
-                
-                # Check validity criteria
-                valid1 = 0.1 < z1 < self.max_depth
-                valid2 = 0.1 < z2 < self.max_depth
-                valid3 = 0.1 < z3 < self.max_depth
-                valid4 = 0.1 < z4 < self.max_depth
-                
-                idx = i * new_w + j
-                
-                # Create triangles only if vertices are valid
-                if valid1 and valid2 and valid3:
-                    faces.append([idx, idx + 1, idx + new_w])
-                
-                if valid2 and valid3 and valid4:
-                    faces.append([idx + 1, idx + new_w + 1, idx + new_w])
-        
-        return cloud.points, np.array(faces), cloud.colors
+        return points_grid.reshape(-1, 3), faces, colors
     
     def export_ply(self, cloud: PointCloud, filepath: str):
         """
-        Export point cloud to PLY format.
+        Export point cloud to binary little-endian PLY format.
         
         Args:
             cloud: Point cloud data
@@ -266,7 +656,7 @@ class SceneReconstruction:
         # PLY header
         header = [
             "ply",
-            "format ascii 1.0",
+            "format binary_little_endian 1.0",
             f"element vertex {n}",
             "property float x",
             "property float y",
@@ -289,20 +679,26 @@ class SceneReconstruction:
         
         header.append("end_header")
         
-        with open(filepath, 'w') as f:
-            f.write('\n'.join(header) + '\n')
-            
-            for i in range(n):
-                line = f"{cloud.points[i, 0]:.6f} {cloud.points[i, 1]:.6f} {cloud.points[i, 2]:.6f}"
-                
-                if has_normals:
-                    line += f" {cloud.normals[i, 0]:.6f} {cloud.normals[i, 1]:.6f} {cloud.normals[i, 2]:.6f}"
-                
-                if has_colors:
-                    r, g, b = cloud.colors[i].astype(int)
-                    line += f" {r} {g} {b}"
-                
-                f.write(line + '\n')
+        # One packed record per vertex, matching the header property order
+        fields = [('x', '<f4'), ('y', '<f4'), ('z', '<f4')]
+        if has_normals:
+            fields += [('nx', '<f4'), ('ny', '<f4'), ('nz', '<f4')]
+        if has_colors:
+            fields += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+        
+        vertices = np.empty(n, dtype=np.dtype(fields))
+        for k, name in enumerate(('x', 'y', 'z')):
+            vertices[name] = cloud.points[:, k]
+        if has_normals:
+            for k, name in enumerate(('nx', 'ny', 'nz')):
+                vertices[name] = cloud.normals[:, k]
+        if has_colors:
+            for k, name in enumerate(('red', 'green', 'blue')):
+                vertices[name] = cloud.colors[:, k]
+        
+        with open(filepath, 'wb') as f:
+            f.write(('\n'.join(header) + '\n').encode('ascii'))
+            vertices.tofile(f)
         
         print(f"✅ Exported PLY: {filepath} ({n} points)")
     
@@ -325,15 +721,14 @@ class SceneReconstruction:
         filepath = Path(filepath)
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Prepare binary data
-        positions_bin = vertices.astype(np.float32).tobytes()
-        indices_bin = faces.astype(np.uint32).tobytes()
+        # Prepare binary data (contiguous arrays are written as-is, no copies)
+        positions_bin = np.ascontiguousarray(vertices, dtype=np.float32)
+        indices_bin = np.ascontiguousarray(faces, dtype=np.uint32)
         
         if colors is not None:
-            colors_normalized = (colors / 255.0).astype(np.float32)
-            colors_bin = colors_normalized.tobytes()
+            colors_bin = np.divide(colors, np.float32(255), dtype=np.float32)
         else:
-            colors_bin = b''
+            colors_bin = np.empty(0, dtype=np.float32)
         
         # Calculate bounds
         pos_min = vertices.min(axis=0).tolist()
@@ -341,78 +736,51 @@ class SceneReconstruction:
         
         # Buffer layout
         pos_offset = 0
-        pos_length = len(positions_bin)
+        pos_length = positions_bin.nbytes
         
         idx_offset = pos_length
-        idx_length = len(indices_bin)
+        idx_length = indices_bin.nbytes
         
         col_offset = idx_offset + idx_length
-        col_length = len(colors_bin)
+        col_length = colors_bin.nbytes
         
         total_buffer_length = pos_length + idx_length + col_length
         
-        # Create GLTF JSON
-        gltf = {
-            "asset": {"version": "2.0", "generator": "DepthAnything_SceneReconstruction"},
-            "scene": 0,
-            "scenes": [{"nodes": [0]}],
-            "nodes": [{"mesh": 0}],
-            "meshes": [{"primitives": [{"attributes": {"POSITION": 0}, "indices": 1, "mode": 4}]}],
-            "accessors": [
-                {
-                    "bufferView": 0,
-                    "componentType": 5126,
-                    "count": len(vertices),
-                    "type": "VEC3",
-                    "min": pos_min,
-                    "max": pos_max
-                },
-                {
-                    "bufferView": 1,
-                    "componentType": 5125,
-                    "count": len(faces) * 3,
-                    "type": "SCALAR"
-                },
-            ],
-            "bufferViews": [
-                {"buffer": 0, "byteOffset": pos_offset, "byteLength": pos_length},
-                {"buffer": 0, "byteOffset": idx_offset, "byteLength": idx_length},
-            ],
-            "buffers": [{"byteLength": total_buffer_length}]
-        }
-        
-        if colors is not None and col_length > 0:
-            gltf["meshes"][0]["primitives"][0]["attributes"]["COLOR_0"] = 2
-            gltf["accessors"].append({
-                "bufferView": 2,
-                "componentType": 5126,
-                "count": len(colors),
-                "type": "VEC3"
-            })
-            gltf["bufferViews"].append({
-                "buffer": 0, "byteOffset": col_offset, "byteLength": col_length
-            })
-        
-        gltf_json = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
-        
-        # Pad to 4-byte alignment
-        while len(gltf_json) % 4 != 0:
-            gltf_json += b' '
-        
-        # Binary buffer
-        bin_buffer = positions_bin + indices_bin + colors_bin
-        while len(bin_buffer) % 4 != 0:
-            bin_buffer += b'\x00'
-        
-        # GLB structure
-        json_chunk = struct.pack('<I', len(gltf_json)) + b'JSON' + gltf_json
-        bin_chunk = struct.pack('<I', len(bin_buffer)) + b'BIN\x00' + bin_buffer
-        
-        total_length = 12 + len(json_chunk) + len(bin_chunk)
-        header = b'glTF' + struct.pack('<II', 2, total_length)
-        
-        with open(filepath, 'wb') as f:
-            f.write(header + json_chunk + bin_chunk)
+        # Create GLTF JSON (floats use repr, exactly as json.dumps writes them)
+        bounds = '[%r,%r,%r]' % tuple(pos_min), '[%r,%r,%r]' % tuple(pos_max)
+        if col_length > 0:
+            gltf_json = _GLTF_TEMPLATE_COLOR % (
+                len(vertices), *bounds, len(faces) * 3, len(colors),
+                pos_offset, pos_length, idx_offset, idx_length,
+                col_offset, col_length, total_buffer_length,
+            )
+        else:
+            gltf_json = _GLTF_TEMPLATE % (
+                len(vertices), *bounds, len(faces) * 3,
+                pos_offset, pos_length, idx_offset, idx_length,
+                total_buffer_length,
+            )
+        gltf_json = gltf_json.encode('ascii')
+        
+        # Pad both chunks to 4-byte alignment
+        gltf_json += b' ' * (-len(gltf_json) & 3)
+        bin_padding = -total_buffer_length & 3
+        bin_length = total_buffer_length + bin_padding
+        
+        # GLB structure: header, JSON chunk, BIN chunk (8-byte chunk headers)
+        total_length = 12 + 8 + len(gltf_json) + 8 + bin_length
+        
+        # Hand each region straight from its array to the kernel
+        _write_segments(filepath, [
+            struct.pack('<4sII', b'glTF', 2, total_length),
+            struct.pack('<I4s', len(gltf_json), b'JSON'),
+            gltf_json,
+            struct.pack('<I4s', bin_length, b'BIN\x00'),
+            positions_bin,
+            indices_bin,
+            colors_bin,
+            b'\x00' * bin_padding,
+        ])
         
         print(f"✅ Exported GLB: {filepath} ({len(vertices)} vertices, {len(faces)} triangles)")
     
@@ -423,37 +791,68 @@ class SceneReconstruction:
         output_dir: str,
         frame_id: int,
         formats: List[str] = ["glb"],
+        voxel_size: Optional[float] = 0.05,
     ):
         """
         Reconstruct 3D scene from a video frame.
         
+        Files are written on a background thread; call flush() to wait for
+        them. The returned cloud must not be modified before then.
+        
         Args:
             frame: BGR image
             depth_map: Normalized depth map
             output_dir: Output directory
             frame_id: Frame number
             formats: Output formats (glb, ply)
+            voxel_size: Voxel size for downsampling the point cloud (None = off)
         """
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        # Create point cloud
-        cloud = self.depth_to_pointcloud(depth_map, frame)
+        if output_path != self._output_path:
+            output_path.mkdir(parents=True, exist_ok=True)
+            self._output_path = output_path
+        
+        # Back-project once; the PLY cloud and the GLB mesh share the grid
+        points_grid, valid, colors = self._backproject_full(depth_map, frame)
+        flat_valid = valid.ravel()
+        cloud = PointCloud(
+            points=points_grid.reshape(-1, 3)[flat_valid],
+            colors=colors[flat_valid] if colors is not None else None,
+        )
+        if voxel_size:
+            cloud = self.voxel_downsample(cloud, voxel_size)
         
         if "ply" in formats:
-            self.export_ply(
+            self._submit_export(
+                self.export_ply,
                 cloud,
                 str(output_path / f"frame_{frame_id:05d}.ply")
             )
         
         if "glb" in formats:
-            vertices, faces, colors = self.create_mesh(depth_map, frame)
-            self.export_glb(
+            vertices, faces, colors = self._mesh_from_grid(points_grid, valid, colors)
+            self._submit_export(
+                self.export_glb,
                 vertices, faces, colors,
                 str(output_path / f"frame_{frame_id:05d}.glb")
             )
         
         return cloud
+    
+    def _submit_export(self, export_fn, *args):
+        """Queue an export on the writer pool."""
+        # Drop finished exports; failed ones are kept so flush() re-raises
+        self._pending_exports = [
+            f for f in self._pending_exports
+            if not f.done() or f.exception() is not None
+        ]
+        self._pending_exports.append(self._export_pool.submit(export_fn, *args))
+    
+    def flush(self):
+        """Wait for all queued exports, re-raising the first failure."""
+        pending, self._pending_exports = self._pending_exports, []
+        for future in pending:
+            future.result()
 
 
 # ============================================================================
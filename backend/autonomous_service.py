@@ -6,6 +6,8 @@ Simulates basic self-driving capabilities including path following, LIDAR/Vision
 import asyncio
 import math
 import random
+import time
+import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Tuple
 
@@ -24,15 +26,29 @@ class AutonomousState:
     steering_cmd: float = 0.0
     throttle_cmd: float = 0.0
     brake_cmd: float = 0.0
-    lidar_points: List[Point] = field(default_factory=list)
+    lidar_points: np.ndarray = field(  # (N, 2) float32 x/y in meters
+        default_factory=lambda: np.empty((0, 2), dtype=np.float32)
+    )
     detected_objects: List[Dict[str, Any]] = field(default_factory=list)
 
 class AutonomousService:
+    TICK_S = 0.1  # 10Hz control loop
+    POLL_GRACE_S = 1.0  # get_state() polls count as a watcher for this long
+
     def __init__(self):
         self.state = AutonomousState()
         self.waypoints: List[Point] = []
+        self.waypoints_arr = np.empty((0, 2), dtype=np.float32)  # (N, 2) mirror of waypoints
         self._running = False
+        self._subscribers = 0
+        self._last_poll = float("-inf")
         self._generate_mock_waypoints()
+        
+        # Fixed LIDAR beam directions (36 beams, 10 degrees apart)
+        angles = np.linspace(0, 2 * math.pi, 36, endpoint=False, dtype=np.float32)
+        self._lidar_cos = np.cos(angles)
+        self._lidar_sin = np.sin(angles)
+        self._lidar_buf = np.empty((len(angles), 2), dtype=np.float32)  # reused every tick
 
     def _generate_mock_waypoints(self):
         # Generate a simple loop for testing (Silverstone-ish oval approximation for now)
@@ -46,6 +62,20 @@ class AutonomousService:
                 x=center_x + radius_x * math.cos(theta),
                 y=center_y + radius_y * math.sin(theta)
             ))
+        self._sync_waypoints_arr()
+
+    def _sync_waypoints_arr(self):
+        self.waypoints_arr = np.array(
+            [(p.x, p.y) for p in self.waypoints], dtype=np.float32
+        ).reshape(-1, 2)
+
+    def nearest_waypoint(self, pose_xy: Tuple[float, float]) -> Tuple[int, float]:
+        """Index of and distance to the waypoint closest to pose_xy"""
+        if len(self.waypoints_arr) == 0:
+            return -1, float("inf")
+        d2 = ((self.waypoints_arr - np.asarray(pose_xy, dtype=np.float32)) ** 2).sum(axis=1)
+        idx = int(np.argmin(d2))
+        return idx, math.sqrt(float(d2[idx]))
 
     async def start(self):
         self._running = True
@@ -64,27 +94,46 @@ class AutonomousService:
     def update_waypoints(self, waypoints: List[Point]):
         """Update waypoints from external source (e.g., circuit analyzer)"""
         self.waypoints = waypoints
+        self._sync_waypoints_arr()
         self.state.current_path_index = 0
         print(f"🛤️ Autonomous: Updated with {len(waypoints)} waypoints")
 
+    def subscribe(self):
+        """Register a consumer of perception output (e.g. a streaming client)"""
+        self._subscribers += 1
+
+    def unsubscribe(self):
+        self._subscribers = max(0, self._subscribers - 1)
+
+    def _has_watchers(self) -> bool:
+        return (
+            self._subscribers > 0
+            or time.monotonic() - self._last_poll < self.POLL_GRACE_S
+        )
+
     async def _loop(self):
+        # Sleep to absolute deadlines so processing time and scheduler
+        # latency don't accumulate as drift
+        next_tick = time.monotonic()
         while self._running:
             if self.state.enabled:
-                self._update_perception()
+                # Perception is only simulated for display; skip it unwatched
+                if self._has_watchers():
+                    self._update_perception()
                 self._calculate_control()
-            await asyncio.sleep(0.1)  # 10Hz control loop
+            next_tick += self.TICK_S
+            now = time.monotonic()
+            if next_tick < now:  # Overran a whole tick: resync, don't burst
+                next_tick = now
+            await asyncio.sleep(next_tick - now)
 
     def _update_perception(self):
         # Simulate LIDAR scan (noisy points around track boundaries)
-        self.state.lidar_points = []
-        num_points = 36
-        for i in range(num_points):
-            angle = (2 * math.pi * i) / num_points
-            dist = 20 + random.uniform(-2, 2)  # 20m range
-            self.state.lidar_points.append(Point(
-                x=dist * math.cos(angle),
-                y=dist * math.sin(angle)
-            ))
+        dists = (20 + np.random.uniform(-2, 2, len(self._lidar_cos))).astype(np.float32)  # 20m range
+        pts = self._lidar_buf
+        np.multiply(dists, self._lidar_cos, out=pts[:, 0])
+        np.multiply(dists, self._lidar_sin, out=pts[:, 1])
+        self.state.lidar_points = pts
         
         # Simulate varying driver confidence based on "sensor noise"
         self.state.confidence = max(0.0, min(1.0, 0.9 + random.uniform(-0.05, 0.05)))
@@ -99,13 +148,14 @@ class AutonomousService:
         self.state.brake_cmd = 0.0
 
     def get_state(self) -> Dict[str, Any]:
+        self._last_poll = time.monotonic()
         return {
             "enabled": self.state.enabled,
             "confidence": round(self.state.confidence, 2),
             "perception_status": self.state.perception_status,
             "steering_cmd": round(self.state.steering_cmd, 1),
             "throttle_cmd": round(self.state.throttle_cmd, 2),
-            "lidar_points": [{"x": p.x, "y": p.y} for p in self.state.lidar_points]
+            "lidar_points": self.state.lidar_points.tolist(),  # [[x, y], ...]
         }
 
 autonomous_service = AutonomousService()
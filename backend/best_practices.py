@@ -6,11 +6,33 @@ Safety thresholds, intervention protocols, and data logging for KMUTT Student Fo
 Black Pearl Racing (blackpearlracing.club) - BP16 Neuro-Adaptive Telemetry System.
 """
 
+from collections import deque
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 import json
+import sys
+import time
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # NumPy fallback
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None  # sessions stay in memory
 
 
 class AlertLevel(Enum):
@@ -32,7 +54,16 @@ class InterventionType(Enum):
     IMMEDIATE_STOP = "immediate_stop"
 
 
-@dataclass
+# Interned enum values for the alert hot path (no Enum descriptor lookups);
+# the enums remain the public vocabulary
+_INFO = sys.intern(AlertLevel.INFO.value)
+_WARNING = sys.intern(AlertLevel.WARNING.value)
+_CRITICAL = sys.intern(AlertLevel.CRITICAL.value)
+_HAPTIC_FEEDBACK = sys.intern(InterventionType.HAPTIC_FEEDBACK.value)
+_THROTTLE_LIMIT = sys.intern(InterventionType.THROTTLE_LIMIT.value)
+
+
+@dataclass(slots=True, frozen=True)
 class SafetyThreshold:
     """Safety threshold definition"""
     metric: str
@@ -48,7 +79,7 @@ class SafetyThreshold:
     action_critical: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """Real-time safety alert"""
     id: str
@@ -210,6 +241,75 @@ BP16_THRESHOLDS: Dict[str, SafetyThreshold] = {
 }
 
 
+# Threshold bounds with None replaced by -inf/+inf (never violated), so the
+# checks need no None tests: (critical_min, critical_max, warning_min,
+# warning_max) per metric, and the same bounds as parallel arrays
+# (structure of arrays) for batched checks, rows following _METRIC_INDEX
+def _bound(value: Optional[float], missing: float) -> float:
+    return missing if value is None else value
+
+
+_BOUNDS: Dict[str, Tuple[float, float, float, float]] = {
+    metric: (
+        _bound(t.critical_min, float("-inf")),
+        _bound(t.critical_max, float("inf")),
+        _bound(t.warning_min, float("-inf")),
+        _bound(t.warning_max, float("inf")),
+    )
+    for metric, t in BP16_THRESHOLDS.items()
+}
+_METRIC_INDEX: Dict[str, int] = {metric: i for i, metric in enumerate(BP16_THRESHOLDS)}
+_METRIC_NAMES: Tuple[str, ...] = tuple(BP16_THRESHOLDS)
+_CRIT_MIN, _CRIT_MAX, _WARN_MIN, _WARN_MAX = np.array(
+    list(_BOUNDS.values()), dtype=np.float64
+).T.copy()
+
+
+def _check_batch_loop(values, idx, c_min, c_max, w_min, w_max, out_slot):
+    """
+    Classify each value against its metric's bounds, writing which bound it
+    violates (0 critical_min, 1 critical_max, 2 warning_min, 3 warning_max,
+    -1 none) in the same priority order as check_threshold. Returns the
+    number of violations.
+    """
+    hits = 0
+    for k in range(values.shape[0]):
+        v = values[k]
+        i = idx[k]
+        if v < c_min[i]:
+            out_slot[k] = 0
+        elif v > c_max[i]:
+            out_slot[k] = 1
+        elif v < w_min[i]:
+            out_slot[k] = 2
+        elif v > w_max[i]:
+            out_slot[k] = 3
+        else:
+            out_slot[k] = -1
+            continue
+        hits += 1
+    return hits
+
+
+# No parallel/fastmath: a batch is ~14 lanes and NaN inputs must compare False
+_check_batch_kernel = (
+    njit(cache=__name__ != "__main__")(_check_batch_loop)
+    if njit is not None else None
+)
+
+
+@lru_cache(maxsize=1)
+def _iso_second(sec: int) -> str:
+    """Local ISO date-time prefix for an epoch second (formatted once per second)"""
+    return datetime.fromtimestamp(sec).isoformat()
+
+
+def _iso_from_ns(ts_ns: int) -> str:
+    """ISO timestamp with microseconds for an epoch time in nanoseconds"""
+    sec, rem = divmod(ts_ns, 1_000_000_000)
+    return f"{_iso_second(sec)}.{rem // 1000:06d}"
+
+
 # BP16 Guidelines
 BP16_GUIDELINES = {
     "version": "BP16.2024.1",
@@ -304,60 +404,105 @@ class SafetyMonitor:
     """Real-time safety monitoring and alert generation"""
     
     def __init__(self):
-        self.active_alerts: List[Alert] = []
-        self.alert_history: List[Alert] = []
+        # Active alerts keyed by id (insertion ordered) for O(1) ack/dismiss
+        self._active_by_id: Dict[str, Alert] = {}
+        # asdict() payloads built once per alert, same keys and order
+        self._payload_by_id: Dict[str, Dict] = {}
+        # Running count of active alerts per level, kept in step with the dict
+        self._level_counts: Dict[str, int] = {sys.intern(level.value): 0 for level in AlertLevel}
+        self.alert_history: deque = deque(maxlen=100)  # last 100 alerts
         self.alert_counter = 0
-        self.last_alert_time: Dict[str, float] = {}
+        # Rate limit per (metric, level), in time.monotonic() seconds
+        self.last_alert_time: Dict[Tuple[str, str], float] = {}
+        # Metric -> id of its active critical alert; suppresses warnings
+        # for the metric until that alert is dismissed or a check of the
+        # metric comes back below critical (hysteresis)
+        self._active_critical: Dict[str, str] = {}
         self.min_alert_interval = 5.0  # seconds between same alert type
     
-    def check_threshold(self, metric: str, value: float) -> Optional[Alert]:
-        """Check if a metric violates safety thresholds"""
-        if metric not in BP16_THRESHOLDS:
-            return None
+    @property
+    def active_alerts(self) -> List[Alert]:
+        """Active alerts in the order they were raised"""
+        return list(self._active_by_id.values())
+    
+    def check_threshold(
+        self,
+        metric: str,
+        value: float,
+        now_mono: Optional[float] = None,
+        iso: Optional[str] = None,
+    ) -> Optional[Alert]:
+        """
+        Check if a metric violates safety thresholds
         
-        threshold = BP16_THRESHOLDS[metric]
-        current_time = datetime.now()
+        Args:
+            metric: Threshold name from BP16_THRESHOLDS
+            value: Current metric value
+            now_mono: time.monotonic() reading shared by a batch (taken if None)
+            iso: Wall-clock ISO timestamp shared by a batch (taken if None)
+        """
+        bounds = _BOUNDS.get(metric)
+        if bounds is None:
+            return None
+        c_min, c_max, w_min, w_max = bounds
         
-        # Check critical thresholds
-        level = None
-        threshold_value = None
+        # Critical band first, then warning band (missing bounds are +-inf)
+        if value < c_min:
+            level, threshold_value = _CRITICAL, c_min
+        elif value > c_max:
+            level, threshold_value = _CRITICAL, c_max
+        elif value < w_min:
+            level, threshold_value = _WARNING, w_min
+        elif value > w_max:
+            level, threshold_value = _WARNING, w_max
+        else:
+            self._active_critical.pop(metric, None)
+            return None
         
-        if threshold.critical_min is not None and value < threshold.critical_min:
-            level = AlertLevel.CRITICAL
-            threshold_value = threshold.critical_min
-        elif threshold.critical_max is not None and value > threshold.critical_max:
-            level = AlertLevel.CRITICAL
-            threshold_value = threshold.critical_max
-        elif threshold.warning_min is not None and value < threshold.warning_min:
-            level = AlertLevel.WARNING
-            threshold_value = threshold.warning_min
-        elif threshold.warning_max is not None and value > threshold.warning_max:
-            level = AlertLevel.WARNING
-            threshold_value = threshold.warning_max
+        if now_mono is None:
+            now_mono = time.monotonic()
+        return self._raise_alert(metric, value, level, threshold_value, now_mono, iso)
+    
+    def _raise_alert(
+        self,
+        metric: str,
+        value: float,
+        level: str,
+        threshold_value: float,
+        now_mono: float,
+        iso: Optional[str],
+    ) -> Optional[Alert]:
+        """Rate-limit and record an alert for a violated threshold"""
+        threshold = BP16_THRESHOLDS[metric]
         
-        if level is None:
+        # A warning adds nothing while the metric already has a critical
+        # open; that first below-critical reading is the downgrade, so it
+        # also lifts the suppression for the next one
+        if level is _WARNING and self._active_critical.pop(metric, None) is not None:
             return None
         
-        # Rate limiting
-        last_time = self.last_alert_time.get(metric, 0)
-        if (current_time.timestamp() - last_time) < self.min_alert_interval:
+        # Rate limiting (monotonic, immune to wall-clock adjustments); keyed
+        # by level too so an escalation is never swallowed by a warning
+        key = (metric, level)
+        last_time = self.last_alert_time.get(key)
+        if last_time is not None and (now_mono - last_time) < self.min_alert_interval:
             return None
         
-        self.last_alert_time[metric] = current_time.timestamp()
+        self.last_alert_time[key] = now_mono
         self.alert_counter += 1
         
         # Determine intervention
-        if level == AlertLevel.CRITICAL:
-            intervention = InterventionType.THROTTLE_LIMIT.value
+        if level is _CRITICAL:
+            intervention = _THROTTLE_LIMIT
             message = threshold.action_critical
         else:
-            intervention = InterventionType.HAPTIC_FEEDBACK.value
+            intervention = _HAPTIC_FEEDBACK
             message = threshold.action_warning
         
         alert = Alert(
             id=f"ALT-{self.alert_counter:04d}",
-            timestamp=current_time.isoformat(),
-            level=level.value,
+            timestamp=iso if iso is not None else _iso_from_ns(time.time_ns()),
+            level=level,
             category=threshold.category,
             metric=metric,
             current_value=round(value, 2),
@@ -366,70 +511,207 @@ class SafetyMonitor:
             intervention=intervention
         )
         
-        self.active_alerts.append(alert)
+        self._active_by_id[alert.id] = alert
+        if level is _CRITICAL:
+            self._active_critical[metric] = alert.id
+        self._payload_by_id[alert.id] = asdict(alert)
+        self._level_counts[alert.level] += 1
         self.alert_history.append(alert)
         
-        # Keep only last 100 in history
-        if len(self.alert_history) > 100:
-            self.alert_history = self.alert_history[-100:]
-        
         return alert
     
     def check_all_metrics(self, data: Dict[str, float]) -> List[Alert]:
         """Check all provided metrics against thresholds"""
+        rows = [(_METRIC_INDEX[m], v) for m, v in data.items() if m in _METRIC_INDEX]
+        if not rows:
+            return []
+        idx = np.fromiter((r[0] for r in rows), dtype=np.intp, count=len(rows))
+        vals = np.fromiter((r[1] for r in rows), dtype=np.float64, count=len(rows))
+        
+        # One pass over all bounds: violated bound slot per row, -1 if none
+        if _check_batch_kernel is not None:
+            slots = np.empty(len(rows), dtype=np.int8)
+            _check_batch_kernel(vals, idx, _CRIT_MIN, _CRIT_MAX, _WARN_MIN, _WARN_MAX, slots)
+        else:
+            slots = np.full(len(rows), -1, dtype=np.int8)
+            # Lowest-priority first so critical bounds overwrite warnings
+            slots[vals > _WARN_MAX[idx]] = 3
+            slots[vals < _WARN_MIN[idx]] = 2
+            slots[vals > _CRIT_MAX[idx]] = 1
+            slots[vals < _CRIT_MIN[idx]] = 0
+        
+        # Metrics back inside their bounds lift any critical suppression
+        if self._active_critical:
+            for k in np.flatnonzero(slots < 0).tolist():
+                self._active_critical.pop(_METRIC_NAMES[idx[k]], None)
+        
+        hits = np.flatnonzero(slots >= 0).tolist()
+        if not hits:
+            return []
+        
+        # Alerts are built only for the (rare) violating rows, in input order;
+        # the whole batch shares one clock reading and one ISO timestamp
+        now_mono = time.monotonic()
+        iso = _iso_from_ns(time.time_ns())
         new_alerts = []
-        for metric, value in data.items():
-            alert = self.check_threshold(metric, value)
+        slot_list = slots.tolist()
+        for k in hits:
+            metric = _METRIC_NAMES[idx[k]]
+            slot = slot_list[k]
+            level = _CRITICAL if slot < 2 else _WARNING
+            threshold_value = _BOUNDS[metric][slot]
+            
+            alert = self._raise_alert(
+                metric, rows[k][1], level, threshold_value, now_mono, iso
+            )
             if alert:
                 new_alerts.append(alert)
         return new_alerts
     
     def acknowledge_alert(self, alert_id: str) -> bool:
         """Mark an alert as acknowledged"""
-        for alert in self.active_alerts:
-            if alert.id == alert_id:
-                alert.acknowledged = True
-                return True
-        return False
+        alert = self._active_by_id.get(alert_id)
+        if alert is None:
+            return False
+        alert.acknowledged = True
+        self._payload_by_id[alert_id]["acknowledged"] = True
+        return True
     
     def dismiss_alert(self, alert_id: str) -> bool:
         """Remove an alert from active list"""
-        for i, alert in enumerate(self.active_alerts):
-            if alert.id == alert_id:
-                self.active_alerts.pop(i)
-                return True
-        return False
+        alert = self._active_by_id.pop(alert_id, None)
+        if alert is None:
+            return False
+        del self._payload_by_id[alert_id]
+        if self._active_critical.get(alert.metric) == alert_id:
+            del self._active_critical[alert.metric]
+        self._level_counts[alert.level] -= 1
+        return True
     
     def get_active_alerts(self) -> List[Dict]:
-        """Get all active alerts"""
-        return [asdict(a) for a in self.active_alerts]
+        """Get all active alerts (cached payloads; treat as read-only)"""
+        return list(self._payload_by_id.values())
     
     def get_alert_summary(self) -> Dict:
         """Get alert statistics"""
+        counts = self._level_counts
         return {
-            "total_active": len(self.active_alerts),
-            "critical": sum(1 for a in self.active_alerts if a.level == "critical"),
-            "warning": sum(1 for a in self.active_alerts if a.level == "warning"),
-            "info": sum(1 for a in self.active_alerts if a.level == "info"),
+            "total_active": len(self._active_by_id),
+            "critical": counts[_CRITICAL],
+            "warning": counts[_WARNING],
+            "info": counts[_INFO],
             "total_history": len(self.alert_history)
         }
+    
+    def get_alerts_json(self) -> bytes:
+        """Active alerts and summary as a JSON response body ({"alerts", "summary"})"""
+        if orjson is not None:
+            # orjson walks the slotted Alert dataclasses natively
+            return orjson.dumps({
+                "alerts": list(self._active_by_id.values()),
+                "summary": self.get_alert_summary(),
+            })
+        return json.dumps({
+            "alerts": self.get_active_alerts(),
+            "summary": self.get_alert_summary(),
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 class DataLogger:
-    """Session data logging for analysis and AI training"""
+    """
+    Session data logging for analysis and AI training
     
-    def __init__(self):
+    Telemetry frames are stored column-wise: one float32 row per frame with
+    a column per BP16 metric (NaN where the frame had no value) plus an
+    int64 epoch-nanosecond timestamp column, grown by doubling. ISO
+    formatting is deferred until records are read back. Keys outside
+    BP16_THRESHOLDS are not recorded.
+    
+    Per-metric count/mean/variance/min/max are kept up to date as frames
+    arrive (Welford's algorithm), so summaries never rescan the buffer.
+    
+    With an output_dir and pyarrow installed, each session is streamed to
+    an Arrow IPC file (<output_dir>/<session_id>.arrow) in record batches
+    of FLUSH_ROWS frames, so memory stays bounded for any session length;
+    the in-memory views then only hold frames not yet flushed.
+    """
+    
+    INITIAL_CAPACITY = 4096  # frames; doubled on overflow
+    FLUSH_ROWS = 1024  # frames per Arrow record batch when streaming
+    
+    def __init__(self, output_dir: Optional[str] = None):
         self.session_id: Optional[str] = None
         self.session_start: Optional[datetime] = None
-        self.data_points: List[Dict] = []
         self.events: List[Dict] = []
+        self.output_dir = output_dir
+        self._writer = None
+        self._data_file: Optional[str] = None
+        self._flushed = 0
+        self._allocate(0)
+        self._reset_stats()
+    
+    def _allocate(self, capacity: int) -> None:
+        self._values = np.empty((capacity, len(_METRIC_NAMES)), dtype=np.float32)
+        self._ts = np.empty(capacity, dtype=np.int64)
+        self._count = 0
+    
+    def _grow(self) -> None:
+        capacity = max(self.INITIAL_CAPACITY, 2 * len(self._ts))
+        values = np.empty((capacity, self._values.shape[1]), dtype=np.float32)
+        ts = np.empty(capacity, dtype=np.int64)
+        values[:self._count] = self._values[:self._count]
+        ts[:self._count] = self._ts[:self._count]
+        self._values, self._ts = values, ts
+    
+    def _reset_stats(self) -> None:
+        # [n, mean, M2, min, max] per metric, rows following _METRIC_INDEX
+        self._stats = [[0, 0.0, 0.0, float("inf"), float("-inf")] for _ in _METRIC_NAMES]
+    
+    def _open_writer(self) -> None:
+        """Open the session's Arrow IPC file (timestamp + one float32 column per metric)"""
+        self._schema = pa.schema(
+            [pa.field("timestamp", pa.timestamp("ns"))]
+            + [pa.field(metric, pa.float32()) for metric in _METRIC_NAMES]
+        )
+        directory = Path(self.output_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.session_id}.arrow"
+        self._writer = pa.ipc.new_file(str(path), self._schema)
+        self._data_file = str(path)
+    
+    def _flush(self) -> None:
+        """Write buffered frames as one record batch and rewind the buffer"""
+        n = self._count
+        if self._writer is None or n == 0:
+            return
+        # NaN (metric absent from the frame) is written as null
+        arrays = [pa.array(self._ts[:n].view("datetime64[ns]"))]
+        arrays += [pa.array(self._values[:n, j], from_pandas=True) for j in range(len(_METRIC_NAMES))]
+        self._writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+        self._flushed += n
+        self._count = 0
+    
+    def _close_writer(self) -> None:
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.close()
+        self._writer = None
     
     def start_session(self, driver_name: str, circuit: str) -> str:
         """Start a new logging session"""
+        self._close_writer()
         self.session_id = f"SES-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         self.session_start = datetime.now()
-        self.data_points = []
         self.events = []
+        self._flushed = 0
+        self._data_file = None
+        self._reset_stats()
+        if self.output_dir is not None and pa is not None:
+            self._allocate(self.FLUSH_ROWS)
+            self._open_writer()
+        else:
+            self._allocate(self.INITIAL_CAPACITY)
         
         self.log_event("session_start", {
             "driver": driver_name,
@@ -438,18 +720,98 @@ class DataLogger:
         
         return self.session_id
     
-    def log_data(self, data: Dict) -> None:
-        """Log a telemetry data point"""
-        if self.session_id:
-            self.data_points.append({
-                "timestamp": datetime.now().isoformat(),
-                "data": data
+    def log_data(self, data: Dict, timestamp: Optional[int] = None) -> None:
+        """
+        Log a telemetry data point
+        
+        Args:
+            data: Telemetry frame (metric -> value) to record
+            timestamp: time.time_ns() reading to reuse for the frame (taken if None)
+        """
+        if not self.session_id:
+            return
+        if self._count == len(self._ts):
+            if self._writer is not None:
+                self._flush()
+            else:
+                self._grow()
+        
+        row = [np.nan] * len(_METRIC_NAMES)
+        stats = self._stats
+        for metric, value in data.items():
+            j = _METRIC_INDEX.get(metric)
+            if j is None:
+                continue
+            row[j] = value
+            if value != value:  # NaN
+                continue
+            
+            # Welford running mean / sum of squared deviations
+            st = stats[j]
+            n = st[0] + 1
+            delta = value - st[1]
+            mean = st[1] + delta / n
+            st[0] = n
+            st[1] = mean
+            st[2] += delta * (value - mean)
+            if value < st[3]:
+                st[3] = value
+            if value > st[4]:
+                st[4] = value
+        
+        i = self._count
+        self._values[i] = row
+        self._ts[i] = timestamp if timestamp is not None else time.time_ns()
+        self._count = i + 1
+    
+    def get_metric_stats(self) -> Dict[str, Dict]:
+        """
+        Running statistics for every metric logged this session
+        
+        Returns:
+            {metric: {"count", "mean", "std" (sample), "min", "max"}}
+        """
+        result = {}
+        for metric, (n, mean, m2, lo, hi) in zip(_METRIC_NAMES, self._stats):
+            if n == 0:
+                continue
+            result[metric] = {
+                "count": n,
+                "mean": mean,
+                "std": (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0,
+                "min": lo,
+                "max": hi,
+            }
+        return result
+    
+    def get_data_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Logged frames as columns (views, valid until the next log_data)
+        
+        Returns:
+            {"timestamp": datetime64[ns] (UTC), <metric>: float32 values, ...}
+        """
+        n = self._count
+        columns = {"timestamp": self._ts[:n].view("datetime64[ns]")}
+        for j, metric in enumerate(_METRIC_NAMES):
+            columns[metric] = self._values[:n, j]
+        return columns
+    
+    @property
+    def data_points(self) -> List[Dict]:
+        """Logged frames as {"timestamp": iso, "data": {...}} records"""
+        points = []
+        for ts, row in zip(self._ts[:self._count].tolist(), self._values[:self._count].tolist()):
+            points.append({
+                "timestamp": _iso_from_ns(ts),
+                "data": {m: v for m, v in zip(_METRIC_NAMES, row) if v == v}
             })
+        return points
     
     def log_event(self, event_type: str, details: Dict) -> None:
         """Log a session event"""
         self.events.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_from_ns(time.time_ns()),
             "type": event_type,
             "details": details
         })
@@ -460,14 +822,17 @@ class DataLogger:
             return {}
         
         self.log_event("session_end", {})
+        self._close_writer()
         
         summary = {
             "session_id": self.session_id,
             "start_time": self.session_start.isoformat() if self.session_start else None,
             "end_time": datetime.now().isoformat(),
             "duration_seconds": (datetime.now() - self.session_start).total_seconds() if self.session_start else 0,
-            "data_point_count": len(self.data_points),
-            "event_count": len(self.events)
+            "data_point_count": self._flushed + self._count,
+            "event_count": len(self.events),
+            "metric_stats": self.get_metric_stats(),
+            "data_file": self._data_file
         }
         
         self.session_id = None
@@ -479,16 +844,25 @@ class DataLogger:
             "session_id": self.session_id,
             "active": self.session_id is not None,
             "start_time": self.session_start.isoformat() if self.session_start else None,
-            "data_points_logged": len(self.data_points),
+            "data_points_logged": self._flushed + self._count,
             "events_logged": len(self.events)
         }
 
 
+@lru_cache(maxsize=1)
 def get_bp16_data() -> Dict:
-    """Get BP16 guidelines and thresholds for frontend"""
+    """Get BP16 guidelines and thresholds for frontend (static; built once, treat as read-only)"""
     return {
         "guidelines": BP16_GUIDELINES,
         "thresholds": {k: asdict(v) for k, v in BP16_THRESHOLDS.items()},
         "alert_levels": [level.value for level in AlertLevel],
         "intervention_types": [it.value for it in InterventionType]
     }
+
+
+@lru_cache(maxsize=1)
+def get_bp16_json_bytes() -> bytes:
+    """get_bp16_data() serialized once as compact UTF-8 JSON, ready to send as a response body"""
+    return json.dumps(
+        get_bp16_data(), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
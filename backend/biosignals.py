@@ -58,11 +58,29 @@ Universal Platforms:
 
 import math
 import random
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from datetime import datetime
+from types import MappingProxyType
 import asyncio
+import base64
+import json
+import threading
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None  # NumPy fallback
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # stdlib json fallback
 
 
 class SignalQuality(Enum):
@@ -73,10 +91,13 @@ class SignalQuality(Enum):
     NO_SIGNAL = "no_signal"
 
 
-@dataclass
+_GOOD_QUALITY = SignalQuality.GOOD.value  # Enum attribute lookups are slow per tick
+
+
+@dataclass(slots=True)
 class ECGData:
     """ECG/EKG Signal - Heart electrical activity"""
-    waveform: List[float]  # Raw ECG waveform
+    waveform: np.ndarray  # Raw ECG waveform (float32)
     heart_rate: int        # BPM
     hrv_rmssd: float       # HRV - Root Mean Square of Successive Differences (ms)
     hrv_sdnn: float        # HRV - Standard Deviation of NN intervals (ms)
@@ -85,10 +106,10 @@ class ECGData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EMGData:
     """EMG Signal - Muscle electrical activity"""
-    waveform: List[float]     # Raw EMG waveform
+    waveform: np.ndarray  # Raw EMG waveform (float32)
     rms_amplitude: float      # Root Mean Square amplitude (µV)
     mean_frequency: float     # Mean frequency (Hz)
     fatigue_index: float      # 0-1 fatigue indicator
@@ -100,10 +121,10 @@ class EMGData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GSRData:
     """GSR/EDA Signal - Electrodermal activity (stress/arousal)"""
-    waveform: List[float]     # Raw GSR signal (µS)
+    waveform: np.ndarray  # Raw GSR signal (µS, float32)
     skin_conductance: float   # Skin conductance level (µS)
     scr_peaks: int            # Skin Conductance Response peaks (count)
     scr_amplitude: float      # SCR amplitude
@@ -113,10 +134,10 @@ class GSRData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PPGData:
     """PPG Signal - Photoplethysmography (blood volume)"""
-    waveform: List[float]     # Raw PPG waveform
+    waveform: np.ndarray  # Raw PPG waveform (float32)
     spo2: float               # Blood oxygen saturation (%)
     pulse_rate: int           # Pulse rate (BPM)
     perfusion_index: float    # Blood perfusion (%)
@@ -125,7 +146,7 @@ class PPGData:
     quality: str
 
 
-@dataclass 
+@dataclass(slots=True)
 class EyeTrackingData:
     """Eye Tracking - Gaze and pupil metrics"""
     gaze_x: float             # Gaze position X (normalized 0-1)
@@ -141,10 +162,10 @@ class EyeTrackingData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RespirationData:
     """Respiration - Breathing patterns"""
-    waveform: List[float]     # Breathing waveform
+    waveform: np.ndarray  # Breathing waveform (float32)
     rate: int                 # Breaths per minute
     depth: float              # Breathing depth (relative)
     regularity: float         # 0-1 breathing regularity
@@ -155,7 +176,7 @@ class RespirationData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TemperatureData:
     """Skin Temperature - Thermal stress"""
     skin_temp: float          # Skin temperature (°C)
@@ -165,11 +186,11 @@ class TemperatureData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EOGData:
     """EOG Signal - Eye movement electrooculography"""
-    horizontal_waveform: List[float]  # Horizontal EOG
-    vertical_waveform: List[float]    # Vertical EOG
+    horizontal_waveform: np.ndarray  # Horizontal EOG (float32)
+    vertical_waveform: np.ndarray    # Vertical EOG (float32)
     saccade_count: int        # Saccade count
     fixation_count: int       # Fixation count
     eye_movement_velocity: float  # Velocity (deg/s)
@@ -177,7 +198,7 @@ class EOGData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MotionData:
     """IMU/Motion - Body kinematics and G-forces"""
     acceleration_x: float     # X-axis acceleration (g)
@@ -192,10 +213,10 @@ class MotionData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EEGData:
     """EEG Signal - Brain electrical activity"""
-    waveform: List[float]     # Raw EEG waveform
+    waveform: np.ndarray  # Raw EEG waveform (float32)
     sampling_rate: float      # Hz
     status: str
     # Frequency bands power (µV²)
@@ -212,7 +233,7 @@ class EEGData:
     quality: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EmotionalState:
     """Predicted emotional state from multi-modal fusion"""
     timestamp: str
@@ -234,14 +255,305 @@ class EmotionalState:
     primary_indicators: List[str]
 
 
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    """
+    Field dict of a slotted dataclass; unlike dataclasses.asdict the
+    waveform arrays are shared rather than deep-copied
+    """
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+
+# Intervention by (fatigue > 0.7) | (stress > 0.8) << 1 | (safety_risk > 0.6) << 2;
+# fatigue outranks stress, which outranks a plain safety-risk trigger
+_INTERVENTION_BY_BITS = (
+    None, "FATIGUE_ALERT", "STRESS_REDUCTION", "FATIGUE_ALERT",
+    "ATTENTION_BOOST", "FATIGUE_ALERT", "STRESS_REDUCTION", "FATIGUE_ALERT",
+)
+_INDICATOR_NAMES = ("HIGH_STRESS", "FATIGUE_DETECTED", "HIGH_FOCUS", "DROWSINESS")
+
+
+# PQRST template as piecewise sine segments over the beat phase [0, 1):
+# segment k covers [_ECG_EDGES[k-1], _ECG_EDGES[k]) and contributes
+# amp * sin((phase - start) * omega); flat segments have amp 0
+# (segments: P, flat, Q, R, S, flat, T, flat)
+_ECG_EDGES = np.array([0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.5])
+_ECG_AMP = np.array([0.15, 0.0, -0.1, 1.0, -0.2, 0.0, 0.3, 0.0])
+_ECG_START = np.array([0.0, 0.0, 0.15, 0.2, 0.25, 0.0, 0.35, 0.0])
+_ECG_OMEGA = np.array([10, 0, 20, 20, 20, 0, 6.67, 0]) * math.pi
+
+_TWO_PI = 2 * math.pi
+_SQRT1_2 = math.sqrt(0.5)
+_CORNER_OMEGA = 2 * math.pi * 8  # Cornering cycles per lap
+_BRAKE_OMEGA = 2 * math.pi * 4   # Braking/accel cycles per lap
+_P_OMEGA = 10 * math.pi
+_QRS_OMEGA = 20 * math.pi
+_T_OMEGA = 6.67 * math.pi
+
+# Sine table for the display-only ECG/EEG templates in the numba kernels;
+# nearest-entry lookup stays within ~8e-4 of math.sin for the non-negative
+# arguments used here. The NumPy path keeps np.sin, which beats a gather
+# at 100 samples
+_SIN_LUT_SIZE = 4096
+_SIN_LUT_MASK = _SIN_LUT_SIZE - 1
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / _TWO_PI
+_SIN_LUT = np.sin(np.arange(_SIN_LUT_SIZE) / _SIN_LUT_SCALE)
+
+
+def _lut_sin(x):
+    """Table sine of a non-negative scalar"""
+    return _SIN_LUT[int(x * _SIN_LUT_SCALE + 0.5) & _SIN_LUT_MASK]
+
+
+def _ecg_sample(phase):
+    """PQRST template value at a beat phase in [0, 1)"""
+    if phase < 0.1:  # P wave
+        return 0.15 * _lut_sin(phase * _P_OMEGA)
+    if 0.15 <= phase < 0.2:  # Q wave
+        return -0.1 * _lut_sin((phase - 0.15) * _QRS_OMEGA)
+    if 0.2 <= phase < 0.25:  # R wave
+        return _lut_sin((phase - 0.2) * _QRS_OMEGA)
+    if 0.25 <= phase < 0.3:  # S wave
+        return -0.2 * _lut_sin((phase - 0.25) * _QRS_OMEGA)
+    if 0.35 <= phase < 0.5:  # T wave
+        return 0.3 * _lut_sin((phase - 0.35) * _T_OMEGA)
+    return 0.0
+
+
+def _ppg_sample(phase):
+    """Systolic peak + dicrotic notch pulse value at a beat phase in [0, 1)"""
+    return (math.exp(-((phase - 0.15) ** 2) / 0.01)
+            - 0.3 * math.exp(-((phase - 0.4) ** 2) / 0.02))
+
+
+def _eeg_sample(t, stress):
+    """Delta..gamma band sum at time t; theta/alpha fall and beta/gamma rise with stress"""
+    calm = 1 - stress
+    wt = _TWO_PI * t
+    return (0.1 * _lut_sin(2 * wt)
+            + calm * (0.3 * _lut_sin(6 * wt) + 0.25 * _lut_sin(10 * wt))
+            + stress * (0.2 * _lut_sin(20 * wt) + 0.1 * _lut_sin(40 * wt)))
+
+
+def _ecg_loop(t0, hr, out):
+    """PQRST template sampled at 100 Hz from t0 for a heart rate of hr BPM"""
+    for i in range(out.shape[0]):
+        out[i] = _ecg_sample(((t0 + i * 0.01) * hr / 60) % 1.0)
+
+
+def _emg_loop(t0, burst, out):
+    """EMG bursts modulated by the slow 0.5 * (1 + sin 2t) envelope at 500 Hz"""
+    for i in range(out.shape[0]):
+        out[i] = burst[i] * 0.5 * (1 + math.sin((t0 + i * 0.002) * 2))
+
+
+def _ppg_loop(t0, pulse_rate, out):
+    """PPG pulse shape sampled at 100 Hz"""
+    for i in range(out.shape[0]):
+        out[i] = _ppg_sample(((t0 + i * 0.01) * pulse_rate / 60) % 1.0)
+
+
+def _eeg_loop(t0, stress, out):
+    """EEG band sum sampled at 100 Hz"""
+    for i in range(out.shape[0]):
+        out[i] = _eeg_sample(t0 + i * 0.01, stress)
+
+
+def _waveforms_loop(t0, stress, hr, pulse_rate, breath_rate, noise, gate, out):
+    """
+    Fused single pass writing every get_all_signals waveform into the rows
+    of out (8 x n), each with its own sample period, from one standard
+    normal noise block (8 x n) and one uniform SCR gate (n).
+    Rows: ECG, EMG, GSR, PPG, respiration, EOG h, EOG v, EEG; respiration
+    and EOG fill only the first n // 2 samples
+    """
+    n = out.shape[1]
+    half = n // 2
+    emg_amp = 0.3 + 0.4 * stress
+    gsr_base = 2.0 + 5.0 * stress
+    for i in range(n):
+        t = t0 + i * 0.01
+        out[0, i] = _ecg_sample((t * hr / 60) % 1.0) + 0.02 * noise[0, i]
+        out[1, i] = emg_amp * noise[1, i] * 0.5 * (1 + math.sin((t0 + i * 0.002) * 2))
+        
+        tg = t0 + i * 0.05
+        v = gsr_base + 0.5 * math.sin(tg * 0.1)
+        if gate[i] > 0.8:  # Phasic response (SCR)
+            v += 0.5 * math.sin(tg * 2) ** 10
+        out[2, i] = v + 0.1 * noise[2, i]
+        
+        out[3, i] = _ppg_sample((t * pulse_rate / 60) % 1.0) + 0.02 * noise[3, i]
+        out[7, i] = _eeg_sample(t, stress) + 0.05 * noise[7, i]
+        
+        if i < half:
+            phase = ((t0 + i * 0.1) * breath_rate / 60) % 1.0
+            out[4, i] = math.sin(2 * math.pi * phase) + 0.1 * stress * math.sin(7 * math.pi * phase)
+            te = t0 + i * 0.02
+            out[5, i] = 0.3 * math.sin(te * 3) + 0.1 * noise[5, i]
+            out[6, i] = 0.2 * math.sin(te * 2) + 0.1 * noise[6, i]
+
+
+def _emotion_scores(heart_rate, hrv_rmssd, arousal_index, activation_level,
+                    emg_fatigue_index, shoulder_tension, beta_stress, theta_focus,
+                    attention_index, delta_power, pupil_diameter, blink_rate,
+                    drowsiness_index, saccade_velocity, resp_rate, resp_regularity,
+                    resp_depth, spo2):
+    """
+    Composite emotional-state scores from the fused signal features, as
+    (stress, focus, fatigue, alertness, anxiety, confidence, frustration,
+    flow_state, overall_readiness, safety_risk); all but readiness and
+    risk are clamped to [0, 1]
+    """
+    stress = (
+        0.2 * (heart_rate - 60) / 60 +
+        0.2 * arousal_index +
+        0.15 * activation_level +
+        0.15 * beta_stress +
+        0.1 * (pupil_diameter - 4) / 4 +
+        0.1 * (resp_rate - 12) / 8 +
+        0.1 * (1 - hrv_rmssd / 50)
+    )
+    stress = max(0.0, min(1.0, stress))
+    
+    focus = (
+        0.3 * theta_focus +
+        0.25 * attention_index +
+        0.2 * (1 - blink_rate / 30) +
+        0.15 * (1 - drowsiness_index) +
+        0.1 * resp_regularity
+    )
+    focus = max(0.0, min(1.0, focus))
+    
+    fatigue = (
+        0.2 * drowsiness_index +
+        0.2 * (1 - saccade_velocity / 400) +
+        0.15 * emg_fatigue_index +
+        0.15 * (delta_power / 20) +
+        0.15 * (1 - resp_depth) +
+        0.15 * (blink_rate / 30)
+    )
+    fatigue = max(0.0, min(1.0, fatigue))
+    
+    alertness = max(0.0, min(1.0, 1 - fatigue * 0.7 - stress * 0.3))
+    anxiety = max(0.0, min(1.0, stress * 0.6 + (1 - hrv_rmssd / 50) * 0.4))
+    confidence = max(0.0, min(1.0, (1 - anxiety) * 0.5 + focus * 0.3 + (1 - fatigue) * 0.2))
+    frustration = max(0.0, min(1.0, stress * 0.4 + (1 - focus) * 0.3 + shoulder_tension * 0.3))
+    
+    # Flow state: high focus, moderate stress, low fatigue
+    flow_state = max(0.0, min(1.0, focus * 0.4 + (1 - abs(stress - 0.4)) * 0.3 + (1 - fatigue) * 0.3))
+    
+    # Overall readiness
+    overall_readiness = (
+        0.3 * alertness +
+        0.25 * focus +
+        0.2 * (1 - fatigue) +
+        0.15 * (1 - anxiety) +
+        0.1 * (spo2 / 100)
+    )
+    
+    # Safety risk assessment
+    safety_risk = (
+        0.25 * fatigue +
+        0.2 * (stress if stress > 0.7 else 0.0) +
+        0.2 * drowsiness_index +
+        0.15 * (1.0 if blink_rate > 25 else 0.0) +
+        0.1 * (1 - focus) +
+        0.1 * emg_fatigue_index
+    )
+    
+    return (stress, focus, fatigue, alertness, anxiety, confidence, frustration,
+            flow_state, overall_readiness, safety_risk)
+
+
+if njit is not None:
+    _jit = njit(cache=__name__ != "__main__")
+    # Sample helpers are rebound first so the loops compile against them
+    _lut_sin = _jit(_lut_sin)
+    _ecg_sample = _jit(_ecg_sample)
+    _ppg_sample = _jit(_ppg_sample)
+    _eeg_sample = _jit(_eeg_sample)
+    _ecg_kernel = _jit(_ecg_loop)
+    _emg_kernel = _jit(_emg_loop)
+    _ppg_kernel = _jit(_ppg_loop)
+    _eeg_kernel = _jit(_eeg_loop)
+    _waveforms_kernel = _jit(_waveforms_loop)
+    # Scalar in, scalar tuple out: dispatch is cheap enough to beat the
+    # interpreted arithmetic on every tick
+    _emotion_scores = _jit(_emotion_scores)
+else:
+    _ecg_kernel = _emg_kernel = _ppg_kernel = _eeg_kernel = _waveforms_kernel = None
+
+
+# Shared PCG64 generator; noise is drawn in blocks, never per sample
+_RNG = np.random.default_rng()
+
+
+# EEG bands (delta, theta, alpha, beta, gamma) as angular frequencies
+_EEG_OMEGA = 2 * math.pi * np.array([2.0, 6.0, 10.0, 20.0, 40.0])
+
+
+@lru_cache(maxsize=16)
+def _time_grid(num_points: int, dt: float) -> np.ndarray:
+    """
+    Shared read-only sample offsets i * dt (i < num_points); get_all_signals
+    uses a handful of fixed (num_points, dt) shapes, so after the first tick
+    no index grid is rebuilt
+    """
+    grid = np.arange(num_points, dtype=np.float64) * dt
+    grid.flags.writeable = False
+    return grid
+
+
+# Waveform rows of a get_all_signals tick; respiration and EOG fill only
+# the first half of their row
+WAVEFORM_SIGNALS = ("ecg", "emg", "gsr", "ppg", "respiration",
+                    "eog_horizontal", "eog_vertical", "eeg")
+_HALF_WIDTH_ROWS = frozenset((4, 5, 6))
+
+
+class _WaveformRing:
+    """
+    Circular float32 waveform history, one (rows, width) slot per tick.
+    
+    Slots are width-aligned, so a tick never wraps and its slot is a
+    plain strided view; that view is overwritten depth ticks later.
+    """
+    
+    def __init__(self, rows: int, width: int, depth: int):
+        self.buf = np.zeros((rows, depth * width), dtype=np.float32)
+        self.width = width
+        self.depth = depth
+        self.count = 0  # Ticks written
+        
+    def next_slot(self) -> np.ndarray:
+        """Claim the (rows, width) slot for the next tick"""
+        i = (self.count % self.depth) * self.width
+        self.count += 1
+        return self.buf[:, i:i + self.width]
+    
+    def history(self, row: int, n: int) -> np.ndarray:
+        """Oldest-first copy of the first n samples of each stored tick of a row"""
+        ticks = self.buf[row].reshape(self.depth, self.width)[:, :n]
+        if self.count <= self.depth:
+            return ticks[:self.count].ravel()
+        k = self.count % self.depth
+        return np.concatenate((ticks[k:], ticks[:k])).ravel()
+
+
 class BiosignalSimulator:
     """Realistic biosignal simulation for demo/testing"""
     
+    WAVEFORM_POINTS = 100  # Samples per get_all_signals waveform (respiration/EOG: half)
+    HISTORY_TICKS = 50     # get_all_signals ticks kept by get_waveform_history
+    
     def __init__(self):
         self.time_offset = 0.0
         self.stress_level = 0.3  # Base stress
         self.fatigue_level = 0.2  # Base fatigue
         self.track_position = 0.0
+        # Waveform history of get_all_signals ticks
+        self._history = _WaveformRing(len(WAVEFORM_SIGNALS), self.WAVEFORM_POINTS, self.HISTORY_TICKS)
+        # Serializes ticks taken from worker threads by get_all_signals_async
+        self._tick_lock = threading.Lock()
         
     def update(self, dt: float = 0.1):
         """Update simulation time"""
@@ -258,82 +570,90 @@ class BiosignalSimulator:
         
     def generate_ecg(self, num_points: int = 100) -> ECGData:
         """Generate realistic ECG waveform with PQRST complex"""
-        waveform = []
-        hr = 85 + int(30 * self.stress_level) + random.randint(-3, 3)
+        hr = self._heart_rate()
         
-        for i in range(num_points):
-            t = self.time_offset + i * 0.01
-            # Simplified PQRST waveform
+        # Simplified PQRST waveform
+        if _ecg_kernel is not None:
+            waveform = np.empty(num_points)
+            _ecg_kernel(self.time_offset, hr, waveform)
+        else:
+            t = self.time_offset + _time_grid(num_points, 0.01)
             phase = (t * hr / 60) % 1.0
-            
-            if 0.0 <= phase < 0.1:  # P wave
-                v = 0.15 * math.sin(phase * 10 * math.pi)
-            elif 0.15 <= phase < 0.2:  # Q wave
-                v = -0.1 * math.sin((phase - 0.15) * 20 * math.pi)
-            elif 0.2 <= phase < 0.25:  # R wave
-                v = 1.0 * math.sin((phase - 0.2) * 20 * math.pi)
-            elif 0.25 <= phase < 0.3:  # S wave
-                v = -0.2 * math.sin((phase - 0.25) * 20 * math.pi)
-            elif 0.35 <= phase < 0.5:  # T wave
-                v = 0.3 * math.sin((phase - 0.35) * 6.67 * math.pi)
-            else:
-                v = 0.0
-            
-            v += 0.02 * random.gauss(0, 1)  # Noise
-            waveform.append(v)
-        
-        # Calculate HRV metrics
+            seg = np.searchsorted(_ECG_EDGES, phase, side="right")
+            waveform = _ECG_AMP[seg] * np.sin((phase - _ECG_START[seg]) * _ECG_OMEGA[seg])
+        waveform += _RNG.normal(0.0, 0.02, num_points)  # Noise
+        return self._ecg_data(waveform.astype(np.float32), hr)
+    
+    def _heart_rate(self) -> int:
+        return 85 + int(30 * self.stress_level) + random.randint(-3, 3)
+    
+    def _ecg_data(self, waveform: np.ndarray, hr: int) -> ECGData:
+        # Simulated R-R series; beat-to-beat variability drops with stress,
+        # scaled so the expected RMSSD is 35 - 15 * stress ms
         rr_interval = 60000 / hr  # ms
-        rr_intervals = [rr_interval + random.gauss(0, 20) for _ in range(10)]
+        rr = rr_interval + (35 - 15 * self.stress_level) * _SQRT1_2 * _RNG.standard_normal(10)
+        
+        # Calculate HRV metrics from the series (slices and dot products are
+        # cheaper than np.diff / ndarray.std at 10 samples)
+        d = rr[1:] - rr[:-1]
+        c = rr - rr.sum() / rr.size
+        rmssd = math.sqrt(float(d @ d) / d.size)       # RMS of successive differences
+        sdnn = math.sqrt(float(c @ c) / (rr.size - 1))  # Sample SD of NN intervals
         
         return ECGData(
             waveform=waveform,
             heart_rate=hr,
-            hrv_rmssd=35 - 15 * self.stress_level + random.gauss(0, 5),
-            hrv_sdnn=45 - 20 * self.stress_level + random.gauss(0, 5),
-            hrv_lf_hf_ratio=1.5 + self.stress_level + random.gauss(0, 0.2),
-            rr_intervals=rr_intervals,
-            quality=SignalQuality.GOOD.value
+            hrv_rmssd=rmssd,
+            hrv_sdnn=sdnn,
+            hrv_lf_hf_ratio=1.5 + self.stress_level + 0.2 * float(_RNG.standard_normal()),
+            rr_intervals=rr.tolist(),
+            quality=_GOOD_QUALITY
         )
     
     def generate_emg(self, num_points: int = 100) -> EMGData:
         """Generate EMG signal with muscle activity patterns"""
-        waveform = []
         base_activation = 0.3 + 0.4 * self.stress_level
         
-        for i in range(num_points):
-            t = self.time_offset + i * 0.002
-            # EMG is high-frequency bursts
-            burst = base_activation * random.gauss(0, 1)
-            modulation = 0.5 * (1 + math.sin(t * 2))
-            v = burst * modulation
-            waveform.append(v)
+        # EMG is high-frequency bursts
+        burst = base_activation * _RNG.standard_normal(num_points)
+        if _emg_kernel is not None:
+            waveform = np.empty(num_points)
+            _emg_kernel(self.time_offset, burst, waveform)
+        else:
+            t = self.time_offset + _time_grid(num_points, 0.002)
+            modulation = 0.5 * (1 + np.sin(t * 2))
+            waveform = burst * modulation
+        return self._emg_data(waveform.astype(np.float32))
+    
+    def _emg_data(self, waveform: np.ndarray) -> EMGData:
+        base_activation = 0.3 + 0.4 * self.stress_level
         
         return EMGData(
             waveform=waveform,
-            rms_amplitude=50 + 100 * base_activation + random.gauss(0, 10),
+            rms_amplitude=50 + 100 * base_activation + 10 * float(_RNG.standard_normal()),
             mean_frequency=80 + 40 * (1 - self.fatigue_level),
             fatigue_index=self.fatigue_level,
             activation_level=base_activation,
             grip_tension=0.4 + 0.4 * self.stress_level,
             shoulder_tension=0.3 + 0.3 * self.stress_level + 0.2 * self.fatigue_level,
             neck_tension=0.25 + 0.25 * self.stress_level + 0.3 * self.fatigue_level,
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_gsr(self, num_points: int = 100) -> GSRData:
         """Generate GSR/EDA signal for stress detection"""
-        waveform = []
         base_conductance = 2.0 + 5.0 * self.stress_level
         
-        for i in range(num_points):
-            t = self.time_offset + i * 0.05
-            # Tonic level with slow drift
-            tonic = base_conductance + 0.5 * math.sin(t * 0.1)
-            # Phasic responses (SCRs)
-            scr = 0.5 * max(0, math.sin(t * 2) ** 10) if random.random() > 0.8 else 0
-            v = tonic + scr + 0.1 * random.gauss(0, 1)
-            waveform.append(v)
+        t = self.time_offset + _time_grid(num_points, 0.05)
+        # Tonic level with slow drift
+        tonic = base_conductance + 0.5 * np.sin(t * 0.1)
+        # Phasic responses (SCRs) on ~20% of samples
+        scr = np.where(_RNG.random(num_points) > 0.8, 0.5 * np.sin(t * 2) ** 10, 0.0)
+        waveform = tonic + scr + _RNG.normal(0.0, 0.1, num_points)
+        return self._gsr_data(waveform.astype(np.float32))
+    
+    def _gsr_data(self, waveform: np.ndarray) -> GSRData:
+        base_conductance = 2.0 + 5.0 * self.stress_level
         
         return GSRData(
             waveform=waveform,
@@ -343,31 +663,34 @@ class BiosignalSimulator:
             tonic_level=base_conductance,
             phasic_level=0.5 * self.stress_level,
             arousal_index=self.stress_level,
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_ppg(self, num_points: int = 100) -> PPGData:
         """Generate PPG signal for SpO2 and pulse"""
-        waveform = []
         pulse_rate = 82 + int(25 * self.stress_level)
         
-        for i in range(num_points):
-            t = self.time_offset + i * 0.01
-            # PPG pulse waveform
+        # PPG pulse waveform
+        if _ppg_kernel is not None:
+            waveform = np.empty(num_points)
+            _ppg_kernel(self.time_offset, pulse_rate, waveform)
+        else:
+            t = self.time_offset + _time_grid(num_points, 0.01)
             phase = (t * pulse_rate / 60) % 1.0
             # Systolic peak + dicrotic notch
-            v = math.exp(-((phase - 0.15) ** 2) / 0.01) - 0.3 * math.exp(-((phase - 0.4) ** 2) / 0.02)
-            v += 0.02 * random.gauss(0, 1)
-            waveform.append(v)
-        
+            waveform = np.exp(-((phase - 0.15) ** 2) / 0.01) - 0.3 * np.exp(-((phase - 0.4) ** 2) / 0.02)
+        waveform += _RNG.normal(0.0, 0.02, num_points)
+        return self._ppg_data(waveform.astype(np.float32), pulse_rate)
+    
+    def _ppg_data(self, waveform: np.ndarray, pulse_rate: int) -> PPGData:
         return PPGData(
             waveform=waveform,
-            spo2=98 - 2 * self.fatigue_level + random.gauss(0, 0.5),
+            spo2=98 - 2 * self.fatigue_level + 0.5 * float(_RNG.standard_normal()),
             pulse_rate=pulse_rate,
             perfusion_index=3.5 + 2 * (1 - self.stress_level),
             respiratory_rate=14 + int(6 * self.stress_level),
             pulse_amplitude=0.8 + 0.2 * (1 - self.stress_level),
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_eye_tracking(self) -> EyeTrackingData:
@@ -378,35 +701,35 @@ class BiosignalSimulator:
         
         # Pupil dilates with cognitive load
         base_pupil = 4.0 + 2.0 * self.stress_level
+        z = _RNG.standard_normal(4).tolist()
         
         return EyeTrackingData(
-            gaze_x=base_gaze_x + random.gauss(0, 0.02),
-            gaze_y=base_gaze_y + random.gauss(0, 0.02),
-            pupil_diameter_left=base_pupil + random.gauss(0, 0.2),
-            pupil_diameter_right=base_pupil + random.gauss(0, 0.2),
+            gaze_x=base_gaze_x + 0.02 * z[0],
+            gaze_y=base_gaze_y + 0.02 * z[1],
+            pupil_diameter_left=base_pupil + 0.2 * z[2],
+            pupil_diameter_right=base_pupil + 0.2 * z[3],
             blink_rate=15 + 10 * self.fatigue_level,
             blink_duration=150 + 100 * self.fatigue_level,
             fixation_duration=200 + 100 * (1 - self.stress_level),
             saccade_velocity=300 - 100 * self.fatigue_level,
             cognitive_load=self.stress_level * 0.8,
             drowsiness_index=self.fatigue_level * 0.7,
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_respiration(self, num_points: int = 50) -> RespirationData:
         """Generate respiration signal"""
-        waveform = []
         rate = 12 + int(8 * self.stress_level)
         
-        for i in range(num_points):
-            t = self.time_offset + i * 0.1
-            # Breathing waveform
-            phase = (t * rate / 60) % 1.0
-            v = math.sin(2 * math.pi * phase)
-            # Add irregularity with stress
-            v += 0.1 * self.stress_level * math.sin(7 * math.pi * phase)
-            waveform.append(v)
-        
+        t = self.time_offset + _time_grid(num_points, 0.1)
+        # Breathing waveform
+        phase = (t * rate / 60) % 1.0
+        waveform = np.sin(2 * math.pi * phase)
+        # Add irregularity with stress
+        waveform += 0.1 * self.stress_level * np.sin(7 * math.pi * phase)
+        return self._respiration_data(waveform.astype(np.float32), rate)
+    
+    def _respiration_data(self, waveform: np.ndarray, rate: int) -> RespirationData:
         ie_ratio = 0.4 + 0.1 * self.stress_level  # I:E ratio changes with stress
         inhalation_time = (60 / rate) * ie_ratio
         
@@ -419,35 +742,33 @@ class BiosignalSimulator:
             exhalation_time=(60 / rate) - inhalation_time,
             ie_ratio=ie_ratio,
             phase="inhale" if math.sin(self.time_offset * rate / 60 * 2 * math.pi) > 0 else "exhale",
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_temperature(self) -> TemperatureData:
         """Generate skin temperature data"""
         base_temp = 33.5 + 1.5 * self.stress_level
+        z = _RNG.standard_normal(2).tolist()
         
         return TemperatureData(
-            skin_temp=base_temp + random.gauss(0, 0.1),
-            ambient_temp=25.0 + random.gauss(0, 0.5),
+            skin_temp=base_temp + 0.1 * z[0],
+            ambient_temp=25.0 + 0.5 * z[1],
             temp_gradient=0.1 * self.stress_level,
             thermal_comfort=0.7 - 0.3 * abs(base_temp - 34),
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_eog(self, num_points: int = 50) -> EOGData:
         """Generate EOG signal for eye movements"""
-        h_waveform = []
-        v_waveform = []
-        
-        for i in range(num_points):
-            t = self.time_offset + i * 0.02
-            # Horizontal saccades
-            h = 0.3 * math.sin(t * 3) + 0.1 * random.gauss(0, 1)
-            # Vertical movements
-            v = 0.2 * math.sin(t * 2) + 0.1 * random.gauss(0, 1)
-            h_waveform.append(h)
-            v_waveform.append(v)
-        
+        t = self.time_offset + _time_grid(num_points, 0.02)
+        # Horizontal saccades
+        noise = _RNG.normal(0.0, 0.1, (2, num_points))
+        h_waveform = 0.3 * np.sin(t * 3) + noise[0]
+        # Vertical movements
+        v_waveform = 0.2 * np.sin(t * 2) + noise[1]
+        return self._eog_data(h_waveform.astype(np.float32), v_waveform.astype(np.float32))
+    
+    def _eog_data(self, h_waveform: np.ndarray, v_waveform: np.ndarray) -> EOGData:
         return EOGData(
             horizontal_waveform=h_waveform,
             vertical_waveform=v_waveform,
@@ -455,44 +776,44 @@ class BiosignalSimulator:
             fixation_count=int(15 + 10 * (1 - self.fatigue_level)),
             eye_movement_velocity=250 - 100 * self.fatigue_level,
             microsleep_detected=self.fatigue_level > 0.7 and random.random() > 0.9,
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_motion(self) -> MotionData:
         """Generate IMU/motion data"""
         # Simulate G-forces during racing
-        lateral_g = 2.0 * math.sin(self.track_position * 2 * math.pi * 8)  # Cornering
-        longitudinal_g = 1.5 * math.cos(self.track_position * 2 * math.pi * 4)  # Braking/accel
+        lateral_g = 2.0 * math.sin(self.track_position * _CORNER_OMEGA)  # Cornering
+        longitudinal_g = 1.5 * math.cos(self.track_position * _BRAKE_OMEGA)  # Braking/accel
+        z = _RNG.standard_normal(6).tolist()  # All six noise terms in one draw
         
         return MotionData(
-            acceleration_x=lateral_g + random.gauss(0, 0.1),
-            acceleration_y=longitudinal_g + random.gauss(0, 0.1),
-            acceleration_z=1.0 + 0.1 * random.gauss(0, 1),  # Vertical (1g baseline)
-            gyro_x=10 * math.sin(self.time_offset) + random.gauss(0, 2),
-            gyro_y=5 * math.cos(self.time_offset * 0.5) + random.gauss(0, 2),
-            gyro_z=20 * lateral_g + random.gauss(0, 5),  # Yaw during cornering
-            total_g_force=math.sqrt(lateral_g**2 + longitudinal_g**2 + 1),
+            acceleration_x=lateral_g + 0.1 * z[0],
+            acceleration_y=longitudinal_g + 0.1 * z[1],
+            acceleration_z=1.0 + 0.1 * z[2],  # Vertical (1g baseline)
+            gyro_x=10 * math.sin(self.time_offset) + 2 * z[3],
+            gyro_y=5 * math.cos(self.time_offset * 0.5) + 2 * z[4],
+            gyro_z=20 * lateral_g + 5 * z[5],  # Yaw during cornering
+            total_g_force=math.sqrt(lateral_g * lateral_g + longitudinal_g * longitudinal_g + 1),
             head_position="forward",
             body_sway=0.05 + 0.1 * abs(lateral_g),
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
     def generate_eeg(self, num_points: int = 100) -> EEGData:
         """Generate EEG signal with frequency bands"""
-        waveform = []
-        
-        for i in range(num_points):
-            t = self.time_offset + i * 0.01
-            # Combine frequency bands
-            delta = 0.1 * math.sin(2 * math.pi * 2 * t)
-            theta = 0.3 * (1 - self.stress_level) * math.sin(2 * math.pi * 6 * t)
-            alpha = 0.25 * (1 - self.stress_level) * math.sin(2 * math.pi * 10 * t)
-            beta = 0.2 * self.stress_level * math.sin(2 * math.pi * 20 * t)
-            gamma = 0.1 * self.stress_level * math.sin(2 * math.pi * 40 * t)
-            noise = 0.05 * random.gauss(0, 1)
-            
-            waveform.append(delta + theta + alpha + beta + gamma + noise)
-        
+        # Combine frequency bands
+        if _eeg_kernel is not None:
+            waveform = np.empty(num_points)
+            _eeg_kernel(self.time_offset, self.stress_level, waveform)
+        else:
+            t = self.time_offset + _time_grid(num_points, 0.01)
+            calm = 1 - self.stress_level
+            amps = np.array([0.1, 0.3 * calm, 0.25 * calm, 0.2 * self.stress_level, 0.1 * self.stress_level])
+            waveform = amps @ np.sin(np.multiply.outer(_EEG_OMEGA, t))
+        waveform += _RNG.normal(0.0, 0.05, num_points)  # Noise
+        return self._eeg_data(waveform.astype(np.float32))
+    
+    def _eeg_data(self, waveform: np.ndarray) -> EEGData:
         return EEGData(
             waveform=waveform,
             sampling_rate=1.5,
@@ -506,196 +827,293 @@ class BiosignalSimulator:
             beta_stress=0.3 + 0.4 * self.stress_level,
             attention_index=0.7 - 0.3 * self.fatigue_level,
             meditation_index=0.5 * (1 - self.stress_level),
-            quality=SignalQuality.GOOD.value
+            quality=_GOOD_QUALITY
         )
     
-    def predict_emotional_state(self, ecg: ECGData, emg: EMGData, gsr: GSRData,
-                                 ppg: PPGData, eye: EyeTrackingData, 
-                                 resp: RespirationData, eeg: EEGData) -> EmotionalState:
-        """Fuse multi-modal signals to predict emotional state"""
-        
-        # Calculate composite metrics
-        stress = (
-            0.2 * (ecg.heart_rate - 60) / 60 +
-            0.2 * gsr.arousal_index +
-            0.15 * emg.activation_level +
-            0.15 * eeg.beta_stress +
-            0.1 * (eye.pupil_diameter_left - 4) / 4 +
-            0.1 * (resp.rate - 12) / 8 +
-            0.1 * (1 - ecg.hrv_rmssd / 50)
-        )
-        stress = max(0, min(1, stress))
-        
-        focus = (
-            0.3 * eeg.theta_focus +
-            0.25 * eeg.attention_index +
-            0.2 * (1 - eye.blink_rate / 30) +
-            0.15 * (1 - eye.drowsiness_index) +
-            0.1 * resp.regularity
-        )
-        focus = max(0, min(1, focus))
-        
-        fatigue = (
-            0.2 * eye.drowsiness_index +
-            0.2 * (1 - eye.saccade_velocity / 400) +
-            0.15 * emg.fatigue_index +
-            0.15 * (eeg.delta_power / 20) +
-            0.15 * (1 - resp.depth) +
-            0.15 * (eye.blink_rate / 30)
-        )
-        fatigue = max(0, min(1, fatigue))
-        
-        alertness = 1 - fatigue * 0.7 - stress * 0.3
-        alertness = max(0, min(1, alertness))
-        
-        anxiety = stress * 0.6 + (1 - ecg.hrv_rmssd / 50) * 0.4
-        anxiety = max(0, min(1, anxiety))
-        
-        confidence = (1 - anxiety) * 0.5 + focus * 0.3 + (1 - fatigue) * 0.2
-        confidence = max(0, min(1, confidence))
-        
-        frustration = stress * 0.4 + (1 - focus) * 0.3 + emg.shoulder_tension * 0.3
-        frustration = max(0, min(1, frustration))
+    def _generate_waveforms(self, waves: np.ndarray) -> Tuple[ECGData, EMGData, GSRData, PPGData,
+                                                          RespirationData, EOGData, EEGData]:
+        """
+        Generate every waveform signal in one fused kernel pass, written in
+        place into the rows of waves (see WAVEFORM_SIGNALS)
+        """
+        num_points = waves.shape[1]
+        hr = self._heart_rate()
+        pulse_rate = 82 + int(25 * self.stress_level)
+        rate = 12 + int(8 * self.stress_level)
         
-        # Flow state: high focus, moderate stress, low fatigue
-        flow_state = focus * 0.4 + (1 - abs(stress - 0.4)) * 0.3 + (1 - fatigue) * 0.3
-        flow_state = max(0, min(1, flow_state))
+        _waveforms_kernel(self.time_offset, self.stress_level, hr, pulse_rate, rate,
+                          _RNG.standard_normal((8, num_points)), _RNG.random(num_points), waves)
+        ecg, emg, gsr, ppg, resp, eog_h, eog_v, eeg = waves
+        half = num_points // 2
         
-        # Overall readiness
-        overall_readiness = (
-            0.3 * alertness +
-            0.25 * focus +
-            0.2 * (1 - fatigue) +
-            0.15 * (1 - anxiety) +
-            0.1 * (ppg.spo2 / 100)
+        return (
+            self._ecg_data(ecg, hr),
+            self._emg_data(emg),
+            self._gsr_data(gsr),
+            self._ppg_data(ppg, pulse_rate),
+            self._respiration_data(resp[:half], rate),
+            self._eog_data(eog_h[:half], eog_v[:half]),
+            self._eeg_data(eeg),
         )
-        
-        # Safety risk assessment
-        safety_risk = (
-            0.25 * fatigue +
-            0.2 * (stress if stress > 0.7 else 0) +
-            0.2 * eye.drowsiness_index +
-            0.15 * (1 if eye.blink_rate > 25 else 0) +
-            0.1 * (1 - focus) +
-            0.1 * emg.fatigue_index
+    
+    def predict_emotional_state(self, ecg: ECGData, emg: EMGData, gsr: GSRData,
+                                 ppg: PPGData, eye: EyeTrackingData, 
+                                 resp: RespirationData, eeg: EEGData,
+                                 timestamp: Optional[str] = None) -> EmotionalState:
+        """Fuse multi-modal signals to predict emotional state (timestamp defaults to now)"""
+        return EmotionalState(**self._emotional_state_dict(ecg, emg, gsr, ppg, eye, resp, eeg, timestamp))
+    
+    def _emotional_state_dict(self, ecg: ECGData, emg: EMGData, gsr: GSRData,
+                              ppg: PPGData, eye: EyeTrackingData,
+                              resp: RespirationData, eeg: EEGData,
+                              timestamp: Optional[str]) -> Dict[str, Any]:
+        """EmotionalState fields as a payload-ready dict, in field order"""
+        (stress, focus, fatigue, alertness, anxiety, confidence, frustration,
+         flow_state, overall_readiness, safety_risk) = _emotion_scores(
+            ecg.heart_rate, ecg.hrv_rmssd, gsr.arousal_index, emg.activation_level,
+            emg.fatigue_index, emg.shoulder_tension, eeg.beta_stress, eeg.theta_focus,
+            eeg.attention_index, eeg.delta_power, eye.pupil_diameter_left, eye.blink_rate,
+            eye.drowsiness_index, eye.saccade_velocity, resp.rate, resp.regularity,
+            resp.depth, ppg.spo2
         )
         
         # Determine if intervention needed
-        intervention_needed = safety_risk > 0.6 or fatigue > 0.7 or stress > 0.8
-        intervention_type = None
-        if intervention_needed:
-            if fatigue > 0.7:
-                intervention_type = "FATIGUE_ALERT"
-            elif stress > 0.8:
-                intervention_type = "STRESS_REDUCTION"
-            else:
-                intervention_type = "ATTENTION_BOOST"
+        bits = (fatigue > 0.7) | (stress > 0.8) << 1 | (safety_risk > 0.6) << 2
+        intervention_needed = bits != 0
+        intervention_type = _INTERVENTION_BY_BITS[bits]
         
         # Primary indicators
-        primary_indicators = []
-        if stress > 0.6:
-            primary_indicators.append("HIGH_STRESS")
-        if fatigue > 0.5:
-            primary_indicators.append("FATIGUE_DETECTED")
-        if focus > 0.7:
-            primary_indicators.append("HIGH_FOCUS")
-        if eye.drowsiness_index > 0.5:
-            primary_indicators.append("DROWSINESS")
-        
-        return EmotionalState(
-            timestamp=datetime.now().isoformat(),
-            stress=round(stress, 3),
-            focus=round(focus, 3),
-            fatigue=round(fatigue, 3),
-            alertness=round(alertness, 3),
-            anxiety=round(anxiety, 3),
-            confidence=round(confidence, 3),
-            frustration=round(frustration, 3),
-            flow_state=round(flow_state, 3),
-            overall_readiness=round(overall_readiness, 3),
-            safety_risk=round(safety_risk, 3),
-            intervention_needed=intervention_needed,
-            intervention_type=intervention_type,
-            primary_indicators=primary_indicators
-        )
+        primary_indicators = list(compress(
+            _INDICATOR_NAMES,
+            (stress > 0.6, fatigue > 0.5, focus > 0.7, eye.drowsiness_index > 0.5)
+        ))
+        
+        return {
+            "timestamp": timestamp if timestamp is not None else datetime.now().isoformat(),
+            "stress": round(stress, 3),
+            "focus": round(focus, 3),
+            "fatigue": round(fatigue, 3),
+            "alertness": round(alertness, 3),
+            "anxiety": round(anxiety, 3),
+            "confidence": round(confidence, 3),
+            "frustration": round(frustration, 3),
+            "flow_state": round(flow_state, 3),
+            "overall_readiness": round(overall_readiness, 3),
+            "safety_risk": round(safety_risk, 3),
+            "intervention_needed": intervention_needed,
+            "intervention_type": intervention_type,
+            "primary_indicators": primary_indicators
+        }
     
     def get_all_signals(self) -> Dict[str, Any]:
-        """Get all biosignal data"""
+        """
+        Get all biosignal data.
+        
+        Waveforms are float32 views into the history ring (encode with
+        dumps_json); they stay valid for HISTORY_TICKS - 1 further ticks.
+        """
         self.update()
         
-        ecg = self.generate_ecg()
-        emg = self.generate_emg()
-        gsr = self.generate_gsr()
-        ppg = self.generate_ppg()
+        waves = self._history.next_slot()
+        if _waveforms_kernel is not None:
+            ecg, emg, gsr, ppg, resp, eog, eeg = self._generate_waveforms(waves)
+        else:
+            n = self.WAVEFORM_POINTS
+            ecg = self.generate_ecg(n)
+            emg = self.generate_emg(n)
+            gsr = self.generate_gsr(n)
+            ppg = self.generate_ppg(n)
+            resp = self.generate_respiration(n // 2)
+            eog = self.generate_eog(n // 2)
+            eeg = self.generate_eeg(n)
+            # Copy into the ring slot and hand out its rows, as the fused path does
+            for i, w in ((0, ecg), (1, emg), (2, gsr), (3, ppg), (7, eeg)):
+                waves[i] = w.waveform
+                w.waveform = waves[i]
+            half = waves[:, :n // 2]
+            half[4] = resp.waveform
+            half[5] = eog.horizontal_waveform
+            half[6] = eog.vertical_waveform
+            resp.waveform, eog.horizontal_waveform, eog.vertical_waveform = half[4], half[5], half[6]
         eye = self.generate_eye_tracking()
-        resp = self.generate_respiration()
         temp = self.generate_temperature()
-        eog = self.generate_eog()
         motion = self.generate_motion()
-        eeg = self.generate_eeg()
         
-        emotional_state = self.predict_emotional_state(
-            ecg, emg, gsr, ppg, eye, resp, eeg
+        # The payload takes the emotional state as a dict directly, skipping
+        # the EmotionalState round trip of predict_emotional_state
+        timestamp = datetime.now().isoformat()
+        emotional_state = self._emotional_state_dict(
+            ecg, emg, gsr, ppg, eye, resp, eeg, timestamp
         )
         
         return {
-            "ecg": asdict(ecg),
-            "emg": asdict(emg),
-            "gsr": asdict(gsr),
-            "ppg": asdict(ppg),
-            "eyeTracking": asdict(eye),
-            "respiration": asdict(resp),
-            "temperature": asdict(temp),
-            "eog": asdict(eog),
-            "motion": asdict(motion),
-            "eeg": asdict(eeg),
-            "emotionalState": asdict(emotional_state),
-            "timestamp": datetime.now().isoformat()
+            "ecg": _shallow_asdict(ecg),
+            "emg": _shallow_asdict(emg),
+            "gsr": _shallow_asdict(gsr),
+            "ppg": _shallow_asdict(ppg),
+            "eyeTracking": _shallow_asdict(eye),
+            "respiration": _shallow_asdict(resp),
+            "temperature": _shallow_asdict(temp),
+            "eog": _shallow_asdict(eog),
+            "motion": _shallow_asdict(motion),
+            "eeg": _shallow_asdict(eeg),
+            "emotionalState": emotional_state,
+            "timestamp": timestamp
         }
 
+    
+    async def get_all_signals_async(self) -> Dict[str, Any]:
+        """
+        get_all_signals on a worker thread, keeping the event loop free
+        while a tick is generated (and, once real sensors back the
+        generators, while their reads block)
+        """
+        return await asyncio.to_thread(self._locked_tick)
+    
+    def _locked_tick(self) -> Dict[str, Any]:
+        with self._tick_lock:
+            return self.get_all_signals()
+    
+    def get_waveform_history(self, signal: str) -> np.ndarray:
+        """
+        Oldest-first float32 copy of a waveform over the last HISTORY_TICKS
+        get_all_signals ticks
+        
+        Args:
+            signal: One of WAVEFORM_SIGNALS
+        """
+        row = WAVEFORM_SIGNALS.index(signal)
+        n = self.WAVEFORM_POINTS // 2 if row in _HALF_WIDTH_ROWS else self.WAVEFORM_POINTS
+        return self._history.history(row, n)
+
+
+def _json_default(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def quantize_waveform(waveform: np.ndarray) -> Dict[str, Any]:
+    """
+    int16 transport form of a waveform.
+    
+    Returns:
+        {"offset", "scale", "q"} where q is the base64 of the little-endian
+        int16 samples; decode with q * scale + offset (error <= scale / 2)
+    """
+    lo = float(waveform.min())
+    hi = float(waveform.max())
+    offset = 0.5 * (lo + hi)
+    scale = (hi - lo) / 65534 or 1.0  # Flat signal: all-zero q
+    q = np.rint((waveform.astype(np.float64) - offset) / scale).astype("<i2")
+    return {"offset": offset, "scale": scale, "q": base64.b64encode(q.tobytes()).decode("ascii")}
+
+
+def _quantized_default(obj):
+    if isinstance(obj, np.ndarray) and obj.dtype.kind == "f":
+        return quantize_waveform(obj)
+    return _json_default(obj)
+
+
+def dumps_json(payload: Any, quantize_waveforms: bool = False) -> bytes:
+    """
+    Encode a payload holding get_all_signals output as JSON bytes.
+    
+    orjson serializes the float32 waveform arrays natively; the stdlib
+    fallback converts them with tolist().
+    
+    Args:
+        payload: JSON-ready data, waveforms as ndarrays
+        quantize_waveforms: Emit each waveform as a quantize_waveform
+            object instead of a number list (about a third of the bytes)
+    """
+    if quantize_waveforms:
+        # Without OPT_SERIALIZE_NUMPY every ndarray reaches the default hook
+        if orjson is not None:
+            return orjson.dumps(payload, default=_quantized_default, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(payload, default=_quantized_default).encode()
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_json_default).encode()
+
 
 # Device Integration Templates (for real hardware)
-DEVICE_CONFIGS = {
-    "polar_h10": {
-        "type": "ECG",
-        "connection": "BLE",
-        "python_lib": "bleak",
-        "service_uuid": "0000180d-0000-1000-8000-00805f9b34fb",
-        "sample_rate": 130
-    },
-    "muse_2": {
-        "type": "EEG",
-        "connection": "BLE",
-        "python_lib": "muselsl",
-        "channels": 4,
-        "sample_rate": 256
-    },
-    "empatica_e4": {
-        "type": "Multi",
-        "signals": ["EDA", "PPG", "Temperature", "Accelerometer"],
-        "connection": "E4 Streaming Server",
-        "python_lib": "e4connect",
-        "sample_rate": {"EDA": 4, "PPG": 64, "Temp": 4, "ACC": 32}
-    },
-    "tobii_pro": {
-        "type": "Eye Tracking",
-        "connection": "USB/Ethernet",
-        "python_lib": "tobii-research",
-        "sample_rate": 120
-    },
-    "shimmer3": {
-        "type": "Multi",
-        "signals": ["EMG", "ECG", "GSR", "IMU"],
-        "connection": "Bluetooth",
-        "python_lib": "pyshimmer",
-        "sample_rate": 512
-    },
-    "openbci_cyton": {
-        "type": "Multi",
-        "signals": ["EEG", "EMG", "ECG", "EOG"],
-        "connection": "USB/WiFi",
-        "python_lib": "brainflow",
-        "channels": 8,
-        "sample_rate": 250
-    }
-}
+@dataclass(frozen=True, slots=True)
+class DeviceConfig:
+    """Connection template for a supported biosignal device"""
+    type: str
+    connection: str
+    python_lib: str
+    sample_rate: Any                  # Hz, or read-only per-signal Hz mapping
+    signals: Tuple[str, ...] = ()     # Multi-signal devices only
+    channels: Optional[int] = None
+    service_uuid: Optional[str] = None  # BLE GATT service
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON-ready dict of the fields that are set"""
+        d = {
+            "type": self.type,
+            "connection": self.connection,
+            "python_lib": self.python_lib,
+        }
+        if self.service_uuid is not None:
+            d["service_uuid"] = self.service_uuid
+        if self.signals:
+            d["signals"] = list(self.signals)
+        if self.channels is not None:
+            d["channels"] = self.channels
+        d["sample_rate"] = (dict(self.sample_rate) if isinstance(self.sample_rate, MappingProxyType)
+                            else self.sample_rate)
+        return d
+
+
+DEVICE_CONFIGS = MappingProxyType({
+    "polar_h10": DeviceConfig(
+        type="ECG",
+        connection="BLE",
+        python_lib="bleak",
+        service_uuid="0000180d-0000-1000-8000-00805f9b34fb",
+        sample_rate=130
+    ),
+    "muse_2": DeviceConfig(
+        type="EEG",
+        connection="BLE",
+        python_lib="muselsl",
+        channels=4,
+        sample_rate=256
+    ),
+    "empatica_e4": DeviceConfig(
+        type="Multi",
+        signals=("EDA", "PPG", "Temperature", "Accelerometer"),
+        connection="E4 Streaming Server",
+        python_lib="e4connect",
+        sample_rate=MappingProxyType({"EDA": 4, "PPG": 64, "Temp": 4, "ACC": 32})
+    ),
+    "tobii_pro": DeviceConfig(
+        type="Eye Tracking",
+        connection="USB/Ethernet",
+        python_lib="tobii-research",
+        sample_rate=120
+    ),
+    "shimmer3": DeviceConfig(
+        type="Multi",
+        signals=("EMG", "ECG", "GSR", "IMU"),
+        connection="Bluetooth",
+        python_lib="pyshimmer",
+        sample_rate=512
+    ),
+    "openbci_cyton": DeviceConfig(
+        type="Multi",
+        signals=("EEG", "EMG", "ECG", "EOG"),
+        connection="USB/WiFi",
+        python_lib="brainflow",
+        channels=8,
+        sample_rate=250
+    ),
+})
+
+
+@lru_cache(maxsize=1)
+def get_device_configs_data() -> Dict[str, Dict[str, Any]]:
+    """DEVICE_CONFIGS as plain dicts, built once (the templates are immutable)"""
+    return {name: config.to_dict() for name, config in DEVICE_CONFIGS.items()}
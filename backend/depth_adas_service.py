@@ -202,26 +202,27 @@ class DepthADASService:
         # === Object Detection ===
         detected_objects = []
         if self.yolo_model is not None:
+            # One integral image per frame makes each bbox lookup O(1)
+            self.distance_estimator.prepare_frame(depth_map)
             results = self.yolo_model(frame, verbose=False)
+            boxes, labels, confs = [], [], []
             for result in results:
                 for box in result.boxes:
-                    x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-                    cls = int(box.cls[0])
-                    conf = float(box.conf[0])
-                    label = self.yolo_model.names[cls]
-                    
-                    # Estimate distance from depth map
-                    distance = self.distance_estimator.estimate_for_bbox(
-                        depth_map, x1, y1, x2, y2
-                    )
-                    
-                    detected_objects.append({
-                        'object_id': hash(f"{x1}{y1}{x2}{y2}") % 10000,
-                        'object_class': label,
-                        'distance': distance,
-                        'bbox': (x1, y1, x2, y2),
-                        'confidence': conf,
-                    })
+                    boxes.append(list(map(int, box.xyxy[0].tolist())))
+                    labels.append(self.yolo_model.names[int(box.cls[0])])
+                    confs.append(float(box.conf[0]))
+            
+            # Estimate distances from depth map for all boxes at once
+            distances = self.distance_estimator.estimate_for_bboxes(depth_map, boxes)
+            
+            for (x1, y1, x2, y2), label, conf, distance in zip(boxes, labels, confs, distances):
+                detected_objects.append({
+                    'object_id': hash(f"{x1}{y1}{x2}{y2}") % 10000,
+                    'object_class': label,
+                    'distance': float(distance),
+                    'bbox': (x1, y1, x2, y2),
+                    'confidence': conf,
+                })
         
         # === Collision Warning ===
         warning_state = self.collision_warning.analyze(
@@ -250,13 +251,13 @@ class DepthADASService:
                 'object_class': threat.object_class,
                 'distance': round(threat.distance, 1),
                 'ttc': round(threat.ttc, 1),
-                'level': threat.warning_level.name,
+                'level': threat.warning_level_enum.name,
             })
         
         return ADASState(
             timestamp=time.time(),
             frame_id=frame_id,
-            warning_level=warning_state.highest_level.name,
+            warning_level=warning_state.highest_level_enum.name,
             warning_message=warning_state.warning_message,
             threats=threats_data,
             brake_assist=warning_state.brake_assist_triggered,
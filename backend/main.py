@@ -5,7 +5,7 @@ Comprehensive multi-modal biosignal monitoring for driver safety AI
 BP16 Best Practices compliant
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
@@ -16,10 +16,10 @@ import random
 from datetime import datetime
 
 # Import comprehensive biosignal module
-from biosignals import BiosignalSimulator, DEVICE_CONFIGS
+from biosignals import BiosignalSimulator, dumps_json, get_device_configs_data
 
 # Import BP16 best practices and vehicle telemetry
-from best_practices import SafetyMonitor, DataLogger, get_bp16_data, BP16_THRESHOLDS
+from best_practices import SafetyMonitor, DataLogger, get_bp16_json_bytes, BP16_THRESHOLDS
 from vehicle_telemetry import VehicleSimulator
 
 # Import Real Sensor Drivers
@@ -82,7 +82,7 @@ vehicle_sim = VehicleSimulator()
 
 # Initialize safety monitoring
 safety_monitor = SafetyMonitor()
-data_logger = DataLogger()
+data_logger = DataLogger(output_dir="session_logs")
 
 # Initialize Drivers
 polar_sensor = PolarH10()
@@ -127,10 +127,11 @@ def generate_throttle_curve(mapping_type: str) -> List[dict]:
         points.append({"x": round(x, 2), "y": round(y, 2)})
     return points
 
-def get_full_telemetry_data() -> dict:
-    """Get comprehensive telemetry with all biosignals"""
+def get_full_telemetry_data(biosignals: Optional[dict] = None) -> dict:
+    """Get comprehensive telemetry with all biosignals (takes a fresh tick if none given)"""
     # Get all biosignal data from simulator
-    biosignals = biosignal_sim.get_all_signals()
+    if biosignals is None:
+        biosignals = biosignal_sim.get_all_signals()
     
     # Extract key metrics for dashboard display
     ecg = biosignals["ecg"]
@@ -323,8 +324,8 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             # Send comprehensive telemetry data
-            data = get_full_telemetry_data()
-            await websocket.send_json(data)
+            data = get_full_telemetry_data(await biosignal_sim.get_all_signals_async())
+            await websocket.send_text(dumps_json(data).decode())
             
             # Check for incoming messages (control updates)
             try:
@@ -390,26 +391,28 @@ async def health_check():
     return {"status": "healthy", "version": "3.0.0"}
 
 @app.get("/api/telemetry")
-async def get_telemetry():
-    """Get current comprehensive telemetry snapshot"""
-    return get_full_telemetry_data()
+async def get_telemetry(quantized: bool = False):
+    """Get current comprehensive telemetry snapshot (quantized=true: int16 waveforms)"""
+    data = get_full_telemetry_data(await biosignal_sim.get_all_signals_async())
+    return Response(content=dumps_json(data, quantize_waveforms=quantized), media_type="application/json")
 
 @app.get("/api/biosignals")
-async def get_biosignals():
-    """Get raw biosignal data only"""
-    return biosignal_sim.get_all_signals()
+async def get_biosignals(quantized: bool = False):
+    """Get raw biosignal data only (quantized=true: int16 waveforms)"""
+    signals = await biosignal_sim.get_all_signals_async()
+    return Response(content=dumps_json(signals, quantize_waveforms=quantized), media_type="application/json")
 
 @app.get("/api/emotional-state")
 async def get_emotional_state():
     """Get current emotional state prediction"""
-    signals = biosignal_sim.get_all_signals()
+    signals = await biosignal_sim.get_all_signals_async()
     return signals["emotionalState"]
 
 @app.get("/api/device-configs")
 async def get_device_configs():
     """Get supported device configurations for real hardware integration"""
     return {
-        "supportedDevices": DEVICE_CONFIGS,
+        "supportedDevices": get_device_configs_data(),
         "note": "Use these configurations to integrate real biosignal hardware"
     }
 
@@ -552,15 +555,12 @@ async def get_silverstone():
 @app.get("/api/best-practices")
 async def get_best_practices():
     """Get BP16 guidelines and safety thresholds"""
-    return get_bp16_data()
+    return Response(content=get_bp16_json_bytes(), media_type="application/json")
 
 @app.get("/api/alerts")
 async def get_alerts():
     """Get current active safety alerts"""
-    return {
-        "alerts": safety_monitor.get_active_alerts(),
-        "summary": safety_monitor.get_alert_summary()
-    }
+    return Response(content=safety_monitor.get_alerts_json(), media_type="application/json")
 
 @app.post("/api/alerts/{alert_id}/acknowledge")
 async def acknowledge_alert(alert_id: str):